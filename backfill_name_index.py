@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+One-time migration for the artifact name index.
+
+Artifacts written before record_type-artifact_name_key-index existed have no
+artifact_name_key, so the (sparse) index doesn't see them. This sets the key
+on those items. Safe to re-run.
+
+Run it once after the deploy that creates the index, with the same table
+settings as the API:
+  DYNAMODB_TABLE_NAME=RatingTable python3 backfill_name_index.py
+then redeploy with the index switched on so listings stop scanning:
+  sam deploy --parameter-overrides ArtifactNameIndexReady=true
+"""
+from src.swe_project.api.artifacts_store import TABLE_NAME, backfill_name_keys
+
+
+def main():
+    updated = backfill_name_keys()
+    print(f"✅ Backfilled artifact_name_key on {updated} artifact(s) in {TABLE_NAME}")
+    print("   Next: sam deploy --parameter-overrides ArtifactNameIndexReady=true")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,36 @@
 # lambda/handler.py
 import awsgi
+from src.swe_project.api import artifacts_store
 from src.swe_project.api.app import create_app
 
 # Build the Flask (WSGI) app
 flask_app = create_app()
 
+_WARM = False
+
+
+def _warm():
+    """One-time heavy init kept off the request path.
+
+    The artifact store builds its boto3 resource lazily, which loads the
+    DynamoDB service model on first use, and the first DynamoDB call then
+    pays credential resolution and the TLS handshake. Doing both here moves
+    that cost into the Lambda INIT phase instead of the first request.
+    """
+    global _WARM
+    if _WARM:
+        return
+    try:
+        artifacts_store.warm_connection()
+    except Exception:
+        pass  # best-effort; the first request will build it lazily instead
+    _WARM = True
+
+
+_warm()
+
 
 def handler(event, context):
     """AWS Lambda handler using awsgi for Flask."""
+    _warm()
     return awsgi.response(flask_app, event, context)
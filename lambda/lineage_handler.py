@@ -1,51 +1,56 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
-from typing import Any, Dict, List, Tuple
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
-from boto3.dynamodb.conditions import Key
-from jsonschema import ValidationError, validate
+import orjson
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 # DynamoDB setup
 _TABLE_NAME = os.environ.get("LINEAGE_TABLE_NAME", "ModelLineage")
-_dynamodb = boto3.resource("dynamodb")
-_table = _dynamodb.Table(_TABLE_NAME)
-
-
-# ---------- JSON Schemas for query params ----------
-
-ADJACENCY_REQUEST_SCHEMA: Dict[str, Any] = {
-    "type": "object",
-    "properties": {
-        "entityId": {"type": "string", "minLength": 1},
-    },
-    "required": ["entityId"],
-    "additionalProperties": False,
-}
-
-LINEAGE_REQUEST_SCHEMA: Dict[str, Any] = {
-    "type": "object",
-    "properties": {
-        "entityId": {"type": "string", "minLength": 1},
-        "direction": {
-            "type": "string",
-            "enum": ["upstream", "downstream"],
-        },
-        "depth": {
-            "type": "integer",
-            "minimum": 1,
-            "maximum": 5,
-        },
-    },
-    "required": ["entityId"],
-    "additionalProperties": False,
-}
+# Pool sized above _MAX_BFS_WORKERS so concurrent frontier queries don't
+# queue on botocore's default 10 connections
+_BOTO_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={"mode": "adaptive", "total_max_attempts": 3},
+    connect_timeout=2,
+    read_timeout=5,
+)
+# Low-level client, created on first use and shared across threads; items
+# are deserialized with one module-level TypeDeserializer
+_client = None
+_CLIENT_LOCK = threading.Lock()
+_DESERIALIZER = TypeDeserializer()
+
+# Upper bound on concurrent neighbor queries per BFS level
+_MAX_BFS_WORKERS = 16
+
+# Read-aside cache of adjacency query results, keyed by (entity_id, sk_prefix).
+# Lives for the lifetime of the (warm) Lambda container.
+_ADJ_CACHE: OrderedDict[
+    Tuple[str, Optional[str]], Tuple[float, List[Dict[str, Any]]]
+] = OrderedDict()
+_ADJ_CACHE_TTL = 30.0  # seconds
+_ADJ_CACHE_MAX = 512
+_ADJ_CACHE_LOCK = threading.Lock()
+
+
+# ---------- Query param constraints ----------
+
+_LINEAGE_DIRECTIONS = ("upstream", "downstream")
+_MIN_DEPTH = 1
+_MAX_DEPTH = 5
 
 
 # ---------- Helpers ----------
@@ -55,7 +60,7 @@ def _response(status: int, body: Dict[str, Any]) -> Dict[str, Any]:
     return {
         "statusCode": status,
         "headers": {"Content-Type": "application/json"},
-        "body": json.dumps(body),
+        "body": orjson.dumps(body).decode(),
     }
 
 
@@ -68,31 +73,82 @@ def _get_query_params(event: Dict[str, Any]) -> Dict[str, str]:
     return event.get("queryStringParameters") or {}
 
 
+def _get_client():
+    global _client
+    if _client is None:
+        with _CLIENT_LOCK:
+            if _client is None:
+                _client = boto3.client("dynamodb", config=_BOTO_CONFIG)
+    return _client
+
+
+def _deserialize(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: _DESERIALIZER.deserialize(v) for k, v in item.items()}
+
+
 def _pk(entity_id: str) -> str:
     # Must match the write-side format in lineage_store.py
     return f"NODE#{entity_id}"
 
 
-def _query_all_adjacency(entity_id: str) -> List[Dict[str, Any]]:
-    """Fetch all adjacency edges (IN + OUT) for a node."""
-    resp = _table.query(
-        KeyConditionExpression=Key("PK").eq(_pk(entity_id)),
+# Sort-key prefixes per direction; must match lineage_store._sk
+_SK_PREFIX_OUT = "EDGE#OUT#"
+_SK_PREFIX_IN = "EDGE#IN#"
+
+
+def _query_adjacency(
+    entity_id: str, sk_prefix: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Fetch adjacency edges for a node: all of them, or only those whose sort
+    key starts with sk_prefix (one direction).
+
+    Results are memoized for _ADJ_CACHE_TTL seconds in a bounded LRU so
+    diamond-shaped graphs and hot nodes don't re-query DynamoDB.
+    """
+    cache_key = (entity_id, sk_prefix)
+    now = time.monotonic()
+    with _ADJ_CACHE_LOCK:
+        hit = _ADJ_CACHE.get(cache_key)
+        if hit is not None and now - hit[0] < _ADJ_CACHE_TTL:
+            _ADJ_CACHE.move_to_end(cache_key)
+            return hit[1]
+
+    key_cond = "#pk = :pk"
+    names = {"#pk": "PK"}
+    values: Dict[str, Any] = {":pk": {"S": _pk(entity_id)}}
+    if sk_prefix:
+        key_cond += " AND begins_with(#sk, :sk)"
+        names["#sk"] = "SK"
+        values[":sk"] = {"S": sk_prefix}
+    resp = _get_client().query(
+        TableName=_TABLE_NAME,
+        KeyConditionExpression=key_cond,
+        ExpressionAttributeNames=names,
+        ExpressionAttributeValues=values,
     )
-    return resp.get("Items", [])
+    items = [_deserialize(item) for item in resp.get("Items", [])]
 
+    with _ADJ_CACHE_LOCK:
+        _ADJ_CACHE[cache_key] = (now, items)
+        _ADJ_CACHE.move_to_end(cache_key)
+        while len(_ADJ_CACHE) > _ADJ_CACHE_MAX:
+            _ADJ_CACHE.popitem(last=False)
+    return items
 
-def _get_validated_adjacency_params(event: Dict[str, Any]) -> Dict[str, Any]:
-    raw = _get_query_params(event)
-    obj: Dict[str, Any] = {
-        "entityId": raw.get("entityId"),
-    }
 
-    try:
-        validate(instance=obj, schema=ADJACENCY_REQUEST_SCHEMA)
-    except ValidationError as e:
-        raise ValueError(f"Invalid adjacency request: {e.message}") from e
+def _validate_entity_id(raw: Dict[str, str], kind: str) -> str:
+    entity_id = raw.get("entityId")
+    if entity_id is None:
+        raise ValueError(f"Invalid {kind} request: 'entityId' is a required property")
+    if not isinstance(entity_id, str) or not entity_id:
+        raise ValueError(f"Invalid {kind} request: 'entityId' must be a non-empty string")
+    return entity_id
+
 
-    return obj
+def _get_validated_adjacency_params(event: Dict[str, Any]) -> Dict[str, Any]:
+    raw = _get_query_params(event)
+    return {"entityId": _validate_entity_id(raw, "adjacency")}
 
 
 def _get_validated_lineage_params(event: Dict[str, Any]) -> Dict[str, Any]:
@@ -107,19 +163,22 @@ def _get_validated_lineage_params(event: Dict[str, Any]) -> Dict[str, Any]:
     except ValueError:
         raise ValueError("depth must be an integer")  # will be turned into 400
 
-    obj: Dict[str, Any] = {
-        "entityId": raw.get("entityId"),
+    entity_id = _validate_entity_id(raw, "lineage")
+    if direction not in _LINEAGE_DIRECTIONS:
+        raise ValueError(
+            f"Invalid lineage request: direction must be one of {list(_LINEAGE_DIRECTIONS)}"
+        )
+    if not _MIN_DEPTH <= depth <= _MAX_DEPTH:
+        raise ValueError(
+            f"Invalid lineage request: depth must be between {_MIN_DEPTH} and {_MAX_DEPTH}"
+        )
+
+    return {
+        "entityId": entity_id,
         "direction": direction,
         "depth": depth,
     }
 
-    try:
-        validate(instance=obj, schema=LINEAGE_REQUEST_SCHEMA)
-    except ValidationError as e:
-        raise ValueError(f"Invalid lineage request: {e.message}") from e
-
-    return obj
-
 
 # ---------- Handlers ----------
 
@@ -136,7 +195,7 @@ def _handle_adjacency(event: Dict[str, Any]) -> Dict[str, Any]:
     entity_id = params["entityId"]
 
     try:
-        items = _query_all_adjacency(entity_id)
+        items = _query_adjacency(entity_id)
     except Exception as e:
         logger.exception("Failed to query adjacency for %s", entity_id)
         return _response(
@@ -176,19 +235,30 @@ def _neighbors_for_direction(
       - "downstream" => use OUT edges (from_id -> to_id)
       - "upstream"   => use IN  edges (from_id -> to_id, but we walk to from_id)
     """
-    items = _query_all_adjacency(entity_id)
-    result: List[Dict[str, Any]] = []
-
     if direction == "downstream":
-        for item in items:
-            if item.get("direction") == "OUT":
-                result.append(item)
-    else:  # upstream
-        for item in items:
-            if item.get("direction") == "IN":
-                result.append(item)
+        return _query_adjacency(entity_id, _SK_PREFIX_OUT)
+    return _query_adjacency(entity_id, _SK_PREFIX_IN)
+
 
-    return result
+def _query_frontier(
+    entity_ids: List[str], direction: str
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Fetch neighbors for every node of a BFS level at once.
+
+    BatchGetItem needs exact keys, not partition queries, so this fans out
+    one Query per node over a thread pool instead.
+    """
+    if len(entity_ids) == 1:
+        nid = entity_ids[0]
+        return {nid: _neighbors_for_direction(nid, direction)}
+
+    workers = min(len(entity_ids), _MAX_BFS_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        results = ex.map(
+            lambda nid: _neighbors_for_direction(nid, direction), entity_ids
+        )
+        return dict(zip(entity_ids, results))
 
 
 def _compute_lineage(
@@ -197,6 +267,9 @@ def _compute_lineage(
     """
     BFS lineage traversal up to 'depth' levels.
 
+    Each level's frontier is queried at once via _query_frontier, so a level
+    costs roughly one DynamoDB round-trip instead of one per node.
+
     Returns:
       nodes: list of {"id": ..., "level": ...}
       edges: list of {"from": ..., "to": ..., "edge_type": ...}
@@ -204,42 +277,47 @@ def _compute_lineage(
     visited = set([root_id])
     nodes: List[Dict[str, Any]] = [{"id": root_id, "level": 0}]
     edges: List[Dict[str, Any]] = []
-
-    # Queue of (node_id, level)
-    queue: List[Tuple[str, int]] = [(root_id, 0)]
-
-    while queue:
-        current_id, level = queue.pop(0)
-        if level >= depth:
-            continue
-
-        neighbors = _neighbors_for_direction(current_id, direction)
-
-        for item in neighbors:
-            edge_type = item.get("edge_type")
-            from_id = item.get("from_id")
-            to_id = item.get("to_id")
-
-            if direction == "downstream":
-                next_id = to_id
-            else:  # upstream
-                next_id = from_id
-
-            if next_id is None:
-                continue
-
-            edges.append(
-                {
-                    "from": from_id,
-                    "to": to_id,
-                    "edge_type": edge_type,
-                }
-            )
-
-            if next_id not in visited:
-                visited.add(next_id)
-                nodes.append({"id": next_id, "level": level + 1})
-                queue.append((next_id, level + 1))
+    seen_edges: set[Tuple[str, str, str]] = set()
+
+    frontier: List[str] = [root_id]
+    level = 0
+
+    while frontier and level < depth:
+        results = _query_frontier(frontier, direction)
+
+        next_frontier: List[str] = []
+        for nid in frontier:
+            for item in results[nid]:
+                edge_type = item.get("edge_type")
+                from_id = item.get("from_id")
+                to_id = item.get("to_id")
+
+                if direction == "downstream":
+                    next_id = to_id
+                else:  # upstream
+                    next_id = from_id
+
+                if next_id is None:
+                    continue
+
+                edge_key = (from_id, to_id, edge_type)
+                if edge_key not in seen_edges:
+                    seen_edges.add(edge_key)
+                    edges.append(
+                        {
+                            "from": from_id,
+                            "to": to_id,
+                            "edge_type": edge_type,
+                        }
+                    )
+
+                if next_id not in visited:
+                    visited.add(next_id)
+                    nodes.append({"id": next_id, "level": level + 1})
+                    next_frontier.append(next_id)
+
+        frontier = next_frontier
+        level += 1
 
     return nodes, edges
 
@@ -287,7 +365,9 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
       GET /adjacency?entityId=...
       GET /lineage?entityId=...&direction=upstream|downstream&depth=N
     """
-    logger.info("Received event: %s", json.dumps(event))
+    # Full events can be large; only serialize them when debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", orjson.dumps(event).decode())
 
     path = _get_path(event)
     http_method = event.get("requestContext", {}).get("http", {}).get("method") or event.get("httpMethod", "GET")
@@ -1,11 +1,24 @@
 import csv
 import io
-from flask import Blueprint, request, jsonify, Response
+from flask import Blueprint, request, jsonify, Response, stream_with_context
 
 from ..store import STORE
 
 download_bp = Blueprint("download", __name__, url_prefix="/download")
 
+# flush the CSV buffer to the client roughly this often (characters)
+_CSV_CHUNK = 8192
+_EMPTY: dict = {}
+
+
+def _parse(raw, conv):
+    if raw is None:
+        return None
+    try:
+        return conv(raw)
+    except (TypeError, ValueError):
+        return None
+
 
 @download_bp.route("", methods=["GET"])
 def download():
@@ -13,50 +26,45 @@ def download():
     min_score = request.args.get("min_score")
     since = request.args.get("since")
 
-    items = STORE.list()
-
-    # filter: min_score
-    if min_score is not None:
-        try:
-            ms = float(min_score)
-            items = [m for m in items if float(m.get("metrics", {}).get("net_score", 0.0)) >= ms]
-        except Exception:
-            pass
-
-    # filter: since timestamp
-    if since is not None:
-        try:
-            s = int(since)
-            items = [m for m in items if int(m.get("created_at", 0)) >= s]
-        except Exception:
-            pass
+    # unparseable query filters are ignored, same as before they moved into
+    # the store; items whose stored value can't be compared are left out
+    items = STORE.list(
+        min_score=_parse(min_score, float),
+        since=_parse(since, int),
+    )
 
     # JSON response
     if fmt == "json":
         return jsonify({"items": items, "count": len(items)}), 200
 
-    # CSV response
-    output = io.StringIO()
-    writer = csv.writer(output)
+    # CSV response, streamed in chunks so the whole file is never held in memory
+    def generate():
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+
+        def drain():
+            data = buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+            return data
 
-    # find common fields
-    # we will flatten metrics.* into separate CSV columns for clarity
-    if items:
+        # find common fields
+        # we will flatten metrics.* into separate CSV columns for clarity
+        if not items:
+            return
         base_fields = ["id", "name", "created_at", "updated_at"]
-        metric_fields = sorted(items[0].get("metrics", {}).keys())
+        # union over all items so metrics missing from the first row still get a column
+        metric_fields = sorted(set().union(*((m.get("metrics") or _EMPTY) for m in items)))
         header = base_fields + [f"metric.{m}" for m in metric_fields]
         writer.writerow(header)
 
+        # map(dict.get, fields) pulls each row's cells in C; missing keys -> None
         for m in items:
-            row = [
-                m.get("id"),
-                m.get("name"),
-                m.get("created_at"),
-                m.get("updated_at"),
-            ]
-            for mf in metric_fields:
-                row.append(m.get("metrics", {}).get(mf))
-            writer.writerow(row)
-
-    csv_bytes = output.getvalue().encode("utf-8")
-    return Response(csv_bytes, mimetype="text/csv")
+            metrics = m.get("metrics") or _EMPTY
+            writer.writerow([*map(m.get, base_fields), *map(metrics.get, metric_fields)])
+            if buf.tell() >= _CSV_CHUNK:
+                yield drain()
+
+        yield drain()
+
+    return Response(stream_with_context(generate()), mimetype="text/csv")
@@ -1,5 +1,6 @@
 from src.metrics.base import registered
 from src.core.scoring import combine
+from src.core.exec_pool import run_parallel
 from src.core.url_ctx import set_context
 
 import src.metrics.bus_factor          # noqa: F401
@@ -11,6 +12,10 @@ import src.metrics.performance_claims  # noqa: F401
 import src.metrics.ramp_up_time        # noqa: F401
 import src.metrics.size_score          # noqa: F401
 
+# metrics register themselves on import above, so the registry is fixed by
+# now; snapshot it once instead of copying it on every /rate
+_REGISTERED = tuple(registered())
+
 
 def compute_all(model_url, code_url=None, dataset_url=None):
     set_context(model_url, code_url, dataset_url)
@@ -18,26 +23,29 @@ def compute_all(model_url, code_url=None, dataset_url=None):
     metrics = {}
     latencies_ms = {}
 
-    for name, field, compute in registered():
-        try:
-            res = compute(model_url)  # {"value": any, "latency_ms": int}
-        except Exception:
-            res = {"value": 0.0, "latency_ms": 0}
+    # metrics are network-bound; run them concurrently (url_ctx travels with
+    # each task) and then fold results back in registration order
+    results = run_parallel(
+        [(field, (lambda c=c: c(model_url))) for _, field, c in _REGISTERED]
+    )
+
+    for name, field, _ in _REGISTERED:
+        res = results[field]  # {"value": any, "latency_ms": int}
 
         val = res.get("value")
         lat = int(res.get("latency_ms", 0))
         latencies_ms[field] = lat
 
         if field == "size_score" and isinstance(val, dict):
-            vals = list(val.values()) if val else [0.0]
+            # average across hardware targets; empty dict -> 0.0
             try:
-                metrics[field] = sum(float(v) for v in vals) / max(len(vals), 1)
-            except Exception:
+                metrics[field] = sum(map(float, val.values())) / (len(val) or 1)
+            except (TypeError, ValueError):
                 metrics[field] = 0.0
         else:
             try:
                 metrics[field] = float(val)
-            except Exception:
+            except (TypeError, ValueError):
                 metrics[field] = 0.0
 
     net_score = float(combine(metrics))
@@ -0,0 +1,6 @@
+# WSGI entrypoint for running the API under a real server, e.g.
+#   gunicorn -w 4 --threads 8 -b 0.0.0.0:8000 api.wsgi:app
+# (from src/, so the "api" package resolves the same way as "python -m api.app")
+from .app import create_app
+
+app = create_app()
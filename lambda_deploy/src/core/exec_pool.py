@@ -1,26 +1,38 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
 from typing import Any, Callable, Dict, List, Tuple
 
-EXEC = ThreadPoolExecutor(max_workers=8)
-
 
 def run_parallel(
     tasks: List[Tuple[str, Callable[[], Any]]], timeout_s: int = 60
 ) -> Dict[str, Any]:
     """
     tasks: list of (key, fn). Returns {key: fn_result_or_default}.
-    Any exception → {"value": 0.0, "latency_ms": 0}.
+    Any exception, or not finishing within timeout_s → {"value": 0.0, "latency_ms": 0}.
+    Each task runs in a copy of the caller's context, so url_ctx is visible.
+
+    Every call gets its own pool sized to its tasks, so concurrent callers
+    don't queue behind each other.
     """
-    futs = {EXEC.submit(fn): key for key, fn in tasks}
+    ex = ThreadPoolExecutor(max_workers=max(1, len(tasks)))
+    futs = {
+        ex.submit(contextvars.copy_context().run, fn): key for key, fn in tasks
+    }
     out: Dict[str, Any] = {}
-    for fut in as_completed(futs, timeout=timeout_s):
-        key = futs[fut]
-        try:
-            out[key] = fut.result()
-        except Exception:
-            out[key] = {"value": 0.0, "latency_ms": 0}
+    try:
+        for fut in as_completed(futs, timeout=timeout_s):
+            key = futs[fut]
+            try:
+                out[key] = fut.result()
+            except Exception:
+                out[key] = {"value": 0.0, "latency_ms": 0}
+    except TimeoutError:
+        pass  # stragglers get the default below
+    finally:
+        # don't wait on stragglers; their results are discarded
+        ex.shutdown(wait=False, cancel_futures=True)
     # fill any timeouts/missed
     for key, _ in tasks:
         out.setdefault(key, {"value": 0.0, "latency_ms": 0})
@@ -1,14 +1,67 @@
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import re
-from typing import Dict, Optional, Set
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+# Keep-alive session so repeated GitHub API calls reuse TCP/TLS connections.
+# Transient gateway errors are retried at the adapter; a final 5xx is still
+# returned (not raised) so gh_get logs and handles it like any other status.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        ),
+    ),
+)
 
+# Successful GET responses keyed by (url, params). Within the TTL they are
+# served without touching the network; after it they are revalidated with
+# If-None-Match, and GitHub's 304 (which doesn't count against the rate
+# limit) just extends the entry.
+_GH_CACHE: OrderedDict[
+    Tuple[str, Tuple[Tuple[str, str], ...]], Tuple[float, requests.Response]
+] = OrderedDict()
+_GH_CACHE_TTL = 900.0  # seconds
+_GH_CACHE_MAX = 512
+_GH_CACHE_LOCK = threading.Lock()
+
+
+def _remember(
+    key: Tuple[str, Tuple[Tuple[str, str], ...]], res: requests.Response
+) -> None:
+    with _GH_CACHE_LOCK:
+        _GH_CACHE[key] = (time.monotonic(), res)
+        _GH_CACHE.move_to_end(key)
+        while len(_GH_CACHE) > _GH_CACHE_MAX:
+            _GH_CACHE.popitem(last=False)
+
+
+@functools.lru_cache(maxsize=None)
 def gh_headers() -> Dict[str, str]:
+    """
+    GitHub API headers, built once per process on first use.
+
+    Computed lazily rather than at import so a token loaded from .env
+    afterwards is still picked up. The dict is shared: don't mutate it.
+    """
     hdrs: Dict[str, str] = {
         "Accept": "application/vnd.github+json",
         "User-Agent": "swe-project/1.0",
@@ -23,9 +76,19 @@ def gh_get(
     url: str, params: Optional[Dict[str, str]] = None, timeout: int = 10
 ) -> Optional[requests.Response]:
     params = params or {}
+    key = (url, tuple(sorted(params.items())))
+    with _GH_CACHE_LOCK:
+        hit = _GH_CACHE.get(key)
+        if hit is not None and time.monotonic() - hit[0] < _GH_CACHE_TTL:
+            _GH_CACHE.move_to_end(key)
+            return hit[1]
+
     hdrs = gh_headers()
+    etag = hit[1].headers.get("ETag") if hit is not None else None
+    if etag:
+        hdrs = {**hdrs, "If-None-Match": etag}
     try:
-        res = requests.get(url, headers=hdrs, params=params, timeout=timeout)
+        res = _SESSION.get(url, headers=hdrs, params=params, timeout=timeout)
     except requests.RequestException as e:
         logging.warning("[gh_utils] network error %s: %s", url, e)
         return None
@@ -36,37 +99,72 @@ def gh_get(
     ):
         hdrs = {k: v for k, v in hdrs.items() if k.lower() != "authorization"}
         try:
-            res = requests.get(url, headers=hdrs, params=params, timeout=timeout)
+            res = _SESSION.get(url, headers=hdrs, params=params, timeout=timeout)
         except requests.RequestException as e:
             logging.warning("[gh_utils] retry without auth failed %s: %s", url, e)
             return None
 
+    if res.status_code == 304 and hit is not None:
+        _remember(key, hit[1])
+        return hit[1]
     if res.status_code != 200:
         logging.warning("[gh_utils] GET %s -> %s", url, res.status_code)
         return None
+    _remember(key, res)
     return res
 
 
 _RE_GH = re.compile(r"github\.com/([^/]+)/([^/]+)")
+# Branch names tried before asking the API for a repo's default branch
+_COMMON_BRANCHES = ("main", "master")
+
+
+def _tree_files(owner: str, repo: str, ref: str) -> Optional[Set[str]]:
+    """Blob paths of `ref`'s recursive tree, or None if the ref can't be fetched."""
+    tree = gh_get(
+        f"https://api.github.com/repos/{owner}/{repo}/git/trees/{ref}?recursive=1"
+    )
+    if not tree:
+        return None
+    try:
+        # recursive trees of big repos run to megabytes; parse the raw bytes in C
+        j = orjson.loads(tree.content) or {}
+    except orjson.JSONDecodeError:
+        logging.warning("[gh_utils] unparseable tree for %s/%s@%s", owner, repo, ref)
+        return set()
+    if "tree" not in j:
+        # truncated listing
+        return set()
+    return {n.get("path", "") for n in j.get("tree", []) if n.get("type") == "blob"}
 
 
 def get_github_repo_files(repo_url: str) -> Set[str]:
+    """
+    Blob paths of the repo's default-branch tree; empty on any failure.
+
+    Most repos default to main (older ones to master), so those trees are
+    tried directly; the repo metadata is only fetched for default_branch
+    when neither exists. Not memoized here: every lookup goes through
+    gh_get, whose TTL/ETag cache already makes repeats cheap while still
+    revalidating them and never keeping a failed fetch.
+    """
     m = _RE_GH.search(repo_url.replace(".git", ""))
     if not m:
         return set()
     owner, repo = m.groups()
 
+    for ref in _COMMON_BRANCHES:
+        files = _tree_files(owner, repo, ref)
+        if files is not None:
+            return files
+
     info = gh_get(f"https://api.github.com/repos/{owner}/{repo}")
     if not info:
         return set()
-    default_branch = (info.json() or {}).get("default_branch") or "main"
-
-    tree = gh_get(
-        f"https://api.github.com/repos/{owner}/{repo}/git/trees/{default_branch}?recursive=1"
-    )
-    if not tree:
+    try:
+        default_branch = (info.json() or {}).get("default_branch")
+    except (ValueError, AttributeError):
         return set()
-    j = tree.json() or {}
-    if "tree" not in j:
+    if not default_branch or default_branch in _COMMON_BRANCHES:
         return set()
-    return {n.get("path", "") for n in j.get("tree", []) if n.get("type") == "blob"}
+    return _tree_files(owner, repo, default_branch) or set()
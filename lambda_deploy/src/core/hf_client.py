@@ -1,39 +1,108 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 
+import orjson
 from huggingface_hub import HfApi, snapshot_download, hf_hub_download
+from huggingface_hub.utils import EntryNotFoundError, LocalEntryNotFoundError
 from tqdm.auto import tqdm  # needed to silence the progress bars
 
 # -------- CHANGES MADE FOR STEP 2 ---------
-import json
 import os
 from pathlib import Path
 # ------------------------------------------
 
 _api = HfApi()
 
+# Every metric asks HF about the same repo during one /rate call, so results
+# are shared through a small TTL'd LRU keyed by (kind, repo_id, revision).
+# Concurrent misses on one key wait for a single fetch instead of each
+# issuing their own request. Failures are not cached. Cached values are
+# shared, not copied (a ModelInfo with files_metadata can be large): treat
+# them as read-only. model_config, whose dict callers may edit, hands out
+# a copy.
+_CACHE: OrderedDict[Tuple[Hashable, ...], Tuple[float, Any]] = OrderedDict()
+_CACHE_TTL = 300.0  # seconds
+_CACHE_MAX = 2048
+_CACHE_LOCK = threading.Lock()
+# Per-key fetch lock and the number of threads using it; dropped only once
+# the last one is done, so a late arrival never gets a fresh lock while
+# earlier waiters still hold the old one
+_KEY_LOCKS: Dict[Tuple[Hashable, ...], List[Any]] = {}
+
+
+def _cache_get(key: Tuple[Hashable, ...]) -> Tuple[bool, Any]:
+    with _CACHE_LOCK:
+        hit = _CACHE.get(key)
+        if hit is not None and time.monotonic() - hit[0] < _CACHE_TTL:
+            _CACHE.move_to_end(key)
+            return True, hit[1]
+    return False, None
+
+
+def _cached(key: Tuple[Hashable, ...], load: Callable[[], Any]) -> Any:
+    found, value = _cache_get(key)
+    if found:
+        return value
+
+    with _CACHE_LOCK:
+        entry = _KEY_LOCKS.setdefault(key, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            # another thread may have filled it while we waited
+            found, value = _cache_get(key)
+            if not found:
+                value = load()
+                with _CACHE_LOCK:
+                    _CACHE[key] = (time.monotonic(), value)
+                    _CACHE.move_to_end(key)
+                    while len(_CACHE) > _CACHE_MAX:
+                        _CACHE.popitem(last=False)
+    finally:
+        with _CACHE_LOCK:
+            entry[1] -= 1
+            if not entry[1]:
+                del _KEY_LOCKS[key]
+    return value
+
+
+def clear_cache() -> None:
+    """Drop all cached HF lookups (tests, or after a repo is known to change)."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
 
 def model_info(repo_id: str, revision: Optional[str] = None) -> Any:
     """
     Thin wrapper around HfApi.model_info that tolerates older/test fakes
     which may not accept keyword args like 'revision' or 'files_metadata'.
     """
-    try:
-        return _api.model_info(repo_id, revision=revision, files_metadata=True)
-    except TypeError:
-        # test doubles or older clients without kwargs
-        return _api.model_info(repo_id)
+    def load() -> Any:
+        try:
+            return _api.model_info(repo_id, revision=revision, files_metadata=True)
+        except TypeError:
+            # test doubles or older clients without kwargs
+            return _api.model_info(repo_id)
+
+    return _cached(("model_info", repo_id, revision), load)
 
 
 def dataset_info(repo_id: str, revision: Optional[str] = None) -> Any:
     """
     Similar tolerance for dataset_info (some fakes don't accept kwargs).
     """
-    try:
-        return _api.dataset_info(repo_id, revision=revision, files_metadata=True)
-    except TypeError:
-        return _api.dataset_info(repo_id)
+    def load() -> Any:
+        try:
+            return _api.dataset_info(repo_id, revision=revision, files_metadata=True)
+        except TypeError:
+            return _api.dataset_info(repo_id)
+
+    return _cached(("dataset_info", repo_id, revision), load)
 
 
 # this is to silence the progress bars from huggingface_hub snapshot_download
@@ -47,13 +116,24 @@ class SilentTqdm(tqdm):
 
 
 def download_snapshot(repo_id: str, allow_patterns):
-    return str(
-        snapshot_download(
-            repo_id=repo_id,
-            allow_patterns=allow_patterns,
-            local_dir_use_symlinks=False,
-            tqdm_class=SilentTqdm,
-        )
+    # Several metrics snapshot the same repo/patterns (README.md, ...) and a
+    # CLI run can repeat repos, so the resulting local path is shared
+    # through the same TTL'd cache as model_info.
+    patterns = (
+        tuple(allow_patterns)
+        if isinstance(allow_patterns, (list, tuple))
+        else allow_patterns
+    )
+    return _cached(
+        ("snapshot", repo_id, patterns),
+        lambda: str(
+            snapshot_download(
+                repo_id=repo_id,
+                allow_patterns=allow_patterns,
+                local_dir_use_symlinks=False,
+                tqdm_class=SilentTqdm,
+            )
+        ),
     )
 
 
@@ -63,25 +143,59 @@ def model_config(repo_id: str, revision: Optional[str] = None) -> dict:
     """
     Download and parse config.json for a Hugging Face model repo.
 
-    Returns an empty dict if config.json is missing or invalid.
+    Returns an empty dict if config.json is missing or invalid. Each call
+    gets its own copy, so callers may modify it.
     """
-    # Reuse snapshot_download so we don't duplicate logic
-    snapshot_dir = snapshot_download(
-        repo_id=repo_id,
-        revision=revision,
-        allow_patterns=["config.json"],
-        local_dir_use_symlinks=False,
-        tqdm_class=SilentTqdm,
+    return copy.deepcopy(
+        _cached(
+            ("model_config", repo_id, revision),
+            lambda: _load_model_config(repo_id, revision),
+        )
     )
 
-    config_path = Path(snapshot_dir) / "config.json"
-    if not config_path.exists():
+
+def _cached_file(
+    repo_id: str,
+    filename: str,
+    repo_type: Optional[str] = None,
+    revision: Optional[str] = None,
+) -> str:
+    """
+    Path to one repo file, served straight from the local HF cache when it is
+    already there (no ETag round trip); otherwise downloaded as usual.
+    Raises EntryNotFoundError if the repo has no such file, or its subclass
+    LocalEntryNotFoundError if the Hub is unreachable and nothing is cached.
+    """
+    try:
+        return hf_hub_download(
+            repo_id=repo_id,
+            filename=filename,
+            repo_type=repo_type,
+            revision=revision,
+            local_files_only=True,
+        )
+    except LocalEntryNotFoundError:
+        return hf_hub_download(
+            repo_id=repo_id,
+            filename=filename,
+            repo_type=repo_type,
+            revision=revision,
+        )
+
+
+def _load_model_config(repo_id: str, revision: Optional[str]) -> dict:
+    try:
+        config_path = Path(_cached_file(repo_id, "config.json", revision=revision))
+    except LocalEntryNotFoundError:
+        # Hub unreachable and nothing cached: an error, not a missing file
+        raise
+    except EntryNotFoundError:
         return {}
 
     try:
-        with config_path.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError:
+        # orjson decodes UTF-8 and parses in one C pass
+        return orjson.loads(config_path.read_bytes())
+    except orjson.JSONDecodeError:
         # malformed config
         return {}
 
@@ -93,19 +207,20 @@ def readme_text(repo_id: str, repo_type: str = "model", revision: Optional[str]
     This is used to support /artifact/byRegEx which must search names AND READMEs.
     We keep this best-effort: return "" if missing/unavailable.
     """
-    # Try a few common filename casings
+    # HF normalizes to README.md; other casings are only worth trying when
+    # that file is genuinely absent (not when the repo/network is the problem)
     candidates = ["README.md", "readme.md", "README.MD", "README"]
     for filename in candidates:
         try:
-            path = hf_hub_download(
-                repo_id=repo_id,
-                filename=filename,
-                repo_type=repo_type,
-                revision=revision,
-            )
+            path = _cached_file(repo_id, filename, repo_type=repo_type, revision=revision)
             with open(path, "r", encoding="utf-8", errors="ignore") as f:
                 # limit size to keep DynamoDB item small-ish
                 return f.read(50_000)
-        except Exception:
+        except LocalEntryNotFoundError:
+            # Hub unreachable and nothing cached; other casings won't help
+            return ""
+        except EntryNotFoundError:
             continue
+        except Exception:
+            return ""
     return ""
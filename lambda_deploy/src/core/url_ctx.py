@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+from contextvars import ContextVar
 from dataclasses import dataclass
-from threading import RLock
-from typing import Dict, Optional
+from typing import Optional
 
 
 @dataclass(frozen=True)
@@ -12,33 +12,32 @@ class Triplet:
     dataset: Optional[str] = None
 
 
-_MODEL_TO_CTX: Dict[str, Triplet] = {}
-_LOCK = RLock()
+# Per-request/per-model context; no lock needed and concurrent requests can't
+# see each other's URLs. Worker threads inherit it via contextvars.copy_context().
+_CTX: ContextVar[Optional[Triplet]] = ContextVar("url_ctx", default=None)
 
 
 def clear() -> None:
-    with _LOCK:
-        _MODEL_TO_CTX.clear()
+    _CTX.set(None)
 
 
 def set_context(
     model_url: str, code_url: Optional[str], dataset_url: Optional[str]
 ) -> None:
-    with _LOCK:
-        _MODEL_TO_CTX[model_url] = Triplet(
+    _CTX.set(
+        Triplet(
             model=model_url,
             code=(code_url or None),
             dataset=(dataset_url or None),
         )
+    )
 
 
 def get_code_url(model_url: str) -> Optional[str]:
-    with _LOCK:
-        t = _MODEL_TO_CTX.get(model_url)
-        return t.code if t else None
+    t = _CTX.get()
+    return t.code if t and t.model == model_url else None
 
 
 def get_dataset_url(model_url: str) -> Optional[str]:
-    with _LOCK:
-        t = _MODEL_TO_CTX.get(model_url)
-        return t.dataset if t else None
+    t = _CTX.get()
+    return t.dataset if t and t.model == model_url else None
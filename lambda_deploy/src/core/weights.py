@@ -9,8 +9,18 @@ _DEFAULT_EXTS = (".safetensors", ".bin", ".onnx", ".tflite", ".h5", ".pt")
 def total_weight_bytes(root: str, exts: Iterable[str] = _DEFAULT_EXTS) -> int:
     exts = tuple(e.lower() for e in exts)
     total = 0
-    for d, _, files in os.walk(root):
-        for f in files:
-            if f.lower().endswith(exts):
-                total += os.path.getsize(os.path.join(d, f))
+    stack = [root]
+    while stack:
+        d = stack.pop()
+        try:
+            it = os.scandir(d)
+        except OSError:
+            continue  # os.walk skips unreadable dirs the same way
+        with it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e.path)
+                elif e.name.lower().endswith(exts):
+                    # HF snapshots symlink into the blob store, so follow links
+                    total += e.stat().st_size
     return total
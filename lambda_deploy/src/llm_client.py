@@ -3,6 +3,8 @@ from typing import Dict, List
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Load .env file
 load_dotenv()
@@ -15,6 +17,19 @@ BASE_URL = "https://genai.rcac.purdue.edu/api/chat/completions"
 # default model in case env not set
 MODEL = os.getenv("LLM_MODEL", "llama3.1:latest")
 
+# keep TLS connections to the GenAI endpoint alive across calls; metrics may
+# ask concurrently, hence the pool. Retry only covers connection-level
+# failures (POST is not retried once the request has been sent).
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    ),
+)
+
 
 def ask_llm(
     messages: List[Dict[str, str]],
@@ -41,7 +56,7 @@ def ask_llm(
     }
 
     try:
-        response = requests.post(BASE_URL, headers=headers, json=payload, timeout=60)
+        response = _SESSION.post(BASE_URL, headers=headers, json=payload, timeout=60)
         response.raise_for_status()
         data = response.json()
 
@@ -1,9 +1,17 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+from typing import Optional
+
+# background thread that owns the file handler; callers only enqueue records
+_LISTENER: Optional[logging.handlers.QueueListener] = None
 
 
 def setup_logging() -> None:
+    global _LISTENER
     # read env vars
     log_file = os.getenv("LOG_FILE", "default.log")
     log_level_str = os.getenv("LOG_LEVEL", "0").strip()
@@ -23,11 +31,22 @@ def setup_logging() -> None:
         print(f"Invalid LOG_FILE path: {log_file}", file=sys.stderr)
         sys.exit(1)
 
-    # if directory exists, set up logging normally
-    logging.basicConfig(
-        filename=log_file,
-        level=log_level,
-        format="%(asctime)s - [%(levelname)s] - %(message)s",
-    )
+    # if directory exists, set up logging normally; like basicConfig this
+    # leaves an already configured root logger alone
+    root = logging.getLogger()
+    if _LISTENER is None and not root.handlers:
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(
+            logging.Formatter("%(asctime)s - [%(levelname)s] - %(message)s")
+        )
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        _LISTENER = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _LISTENER.start()
+        # stop() drains the queue so nothing logged before exit is lost
+        atexit.register(_LISTENER.stop)
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        root.setLevel(log_level)
 
     logging.info("Logging initialized with level %s", log_level_str)
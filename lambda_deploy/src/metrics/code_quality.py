@@ -1,107 +1,25 @@
 from __future__ import annotations
 
 import logging
-import os
-import re
 import time
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import Any
 
-import requests
+from src.core.gh_utils import get_github_repo_files
 from src.core.hf_client import model_info
 from src.core.model_url import to_repo_id
 from src.metrics.base import MetricResult, register
 
 NAME, FIELD = "code_quality", "code_quality"
 
+# Upper bound on concurrent per-URL fetches in compute
+_URL_WORKERS = 8
 
-def _gh_headers() -> Dict[str, str]:
-    """Creates headers for GitHub API requests, including authorization if available."""
-    hdrs: Dict[str, str] = {
-        "Accept": "application/vnd.github+json",
-        "User-Agent": "swe-project-code-quality/1.0",
-    }
-    tok = (os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN") or "").strip()
-    if tok and tok.lower() not in {"invalid", "none", "placeholder"}:
-        hdrs["Authorization"] = f"Bearer {tok}"
-    return hdrs
-
-
-def _gh_get(
-    url: str, params: Optional[Dict[str, str]] = None, timeout: int = 10
-) -> Optional[requests.Response]:
-    """
-    Performs a GET request to the GitHub API with robust error handling.
-    Retries once without authorization on 401/403 errors.
-    """
-    params = params or {}
-    hdrs = _gh_headers()
-    try:
-        res = requests.get(url, headers=hdrs, params=params, timeout=timeout)
-    except requests.RequestException as e:
-        logging.warning("[code_quality] Network error for %s: %s", url, e)
-        return None
-
-    text_lower = (res.text or "").lower()
-    if res.status_code in (401, 403) and (
-        "bad credentials" in text_lower or "requires authentication" in text_lower
-    ):
-        # Retry once without the auth header if token is bad
-        hdrs = {k: v for k, v in hdrs.items() if k.lower() != "authorization"}
-        try:
-            res = requests.get(url, headers=hdrs, params=params, timeout=timeout)
-        except requests.RequestException as e:
-            logging.warning(
-                "[code_quality] Retry without auth failed for %s: %s", url, e
-            )
-            return None
-
-    if res.status_code != 200:
-        logging.warning(
-            "[code_quality] GET %s returned status %s", url, res.status_code
-        )
-        return None
-    return res
-
-
-def get_github_repo_files(repo_url: str) -> set[str]:
-    """Fetches the list of all files in a GitHub repository's default branch."""
-    match = re.search(r"github\.com/([^/]+)/([^/]+)", repo_url.replace(".git", ""))
-    if not match:
-        return set()
-
-    owner, repo = match.groups()
-
-    # Get repository info to find the default branch
-    repo_info_url = f"https://api.github.com/repos/{owner}/{repo}"
-    repo_res = _gh_get(repo_info_url)
-    if not repo_res:
-        logging.error(f"Failed to fetch repo info from {repo_info_url}")
-        return set()
+# Files that count as dependency metadata for an HF repo
+_HF_DEP_FILES = frozenset({"requirements.txt", "pyproject.toml", "config.json"})
 
-    try:
-        default_branch = repo_res.json().get("default_branch", "main")
-    except (requests.exceptions.JSONDecodeError, AttributeError):
-        logging.error(f"Could not parse JSON or find default_branch for {repo_url}")
-        return set()
-
-    # Get the file tree for the default branch
-    trees_url = f"https://api.github.com/repos/{owner}/{repo}/git/trees/{default_branch}?recursive=1"
-    tree_res = _gh_get(trees_url)
-    if not tree_res:
-        logging.error(f"Failed to fetch file tree from {trees_url}")
-        return set()
-
-    try:
-        data = tree_res.json()
-        if "tree" not in data:
-            logging.warning(
-                f"Response from {trees_url} is truncated: {data.get('message', '')}"
-            )
-            return set()
-        return {item["path"] for item in data.get("tree", []) if item["type"] == "blob"}
-    except (requests.exceptions.JSONDecodeError, AttributeError):
-        logging.error(f"Could not parse JSON response for file tree of {repo_url}")
-        return set()
+_RFILENAME = attrgetter("rfilename")
 
 
 def _score_single_url(analysis_url: str) -> float:
@@ -115,25 +33,23 @@ def _score_single_url(analysis_url: str) -> float:
         else:
             rid, _ = to_repo_id(analysis_url)
             info: Any = model_info(rid)
-            siblings = getattr(info, "siblings", [])
-            filenames = {s.rfilename for s in siblings}
+            # siblings is None when the hub omits the file listing
+            siblings = getattr(info, "siblings", None) or ()
+            filenames = {name for name in map(_RFILENAME, siblings) if name}
 
         total_files = len(filenames)
 
         if total_files > 0:
+            # the only full pass over the file list
+            py_files_count = sum(1 for f in filenames if f.endswith(".py"))
             if is_github:
                 if "requirements.txt" in filenames:
                     score += 0.5
-                py_files_count = sum(1 for f in filenames if f.endswith(".py"))
                 if py_files_count > 0:
                     score += (py_files_count / total_files) * 0.5
             else:
-                py_files_count = sum(1 for f in filenames if f.endswith(".py"))
-                has_deps = (
-                    "requirements.txt" in filenames
-                    or "pyproject.toml" in filenames
-                    or "config.json" in filenames
-                )
+                # probes the three dep names against the set, not the other way round
+                has_deps = not _HF_DEP_FILES.isdisjoint(filenames)
                 if py_files_count > 0:
                     if has_deps:
                         score += 0.3
@@ -150,7 +66,6 @@ def _score_single_url(analysis_url: str) -> float:
 
 def compute(input_line: str) -> MetricResult:
     t0 = time.perf_counter()
-    total_score = 0.0
     urls = [url.strip() for url in input_line.split(",") if url.strip()]
 
     relevant_urls = [
@@ -165,8 +80,15 @@ def compute(input_line: str) -> MetricResult:
             "latency_ms": int(round((time.perf_counter() - t0) * 1000)),
         }
 
-    for url in relevant_urls:
-        total_score += _score_single_url(url)
+    # each URL is a blocking GitHub/HF round trip; fetch them side by side
+    if len(relevant_urls) == 1:
+        scores = [_score_single_url(relevant_urls[0])]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(len(relevant_urls), _URL_WORKERS)
+        ) as ex:
+            scores = list(ex.map(_score_single_url, relevant_urls))
+    total_score = sum(scores)
 
     final_score = max(0.0, min(1.0, total_score))
     return {
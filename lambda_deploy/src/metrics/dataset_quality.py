@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from src.core.hf_client import dataset_info
@@ -9,6 +10,9 @@ from src.metrics.base import MetricResult, register
 
 NAME, FIELD = "dataset_quality", "dataset_quality"
 
+# Upper bound on concurrent dataset_info fetches in compute
+_DATASET_WORKERS = 8
+
 
 def _score_single_dataset(d_info: Any) -> float:
     if getattr(d_info, "gated", False):
@@ -27,9 +31,16 @@ def _score_single_dataset(d_info: Any) -> float:
     return min(1.0, score)
 
 
+def _safe_dataset_score(d_id: str) -> float:
+    try:
+        return _score_single_dataset(dataset_info(d_id))
+    except Exception:
+        logging.warning("%s: failed to fetch info for dataset %s", NAME, d_id)
+        return 0.0
+
+
 def compute(input_line: str) -> MetricResult:
     t0 = time.perf_counter()
-    total_score = 0.0
 
     urls = [url.strip() for url in input_line.split(",") if url.strip()]
     dataset_urls = [url for url in urls if "huggingface.co/datasets/" in url]
@@ -46,13 +57,16 @@ def compute(input_line: str) -> MetricResult:
             for url in dataset_urls
         ]
 
-        for d_id in dataset_ids:
-            try:
-                d_info = dataset_info(d_id)
-                total_score += _score_single_dataset(d_info)
-            except Exception:
-                logging.warning("%s: failed to fetch info for dataset %s", NAME, d_id)
+        # one HF round trip per dataset; overlap them
+        if len(dataset_ids) == 1:
+            scores = [_safe_dataset_score(dataset_ids[0])]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(len(dataset_ids), _DATASET_WORKERS)
+            ) as ex:
+                scores = list(ex.map(_safe_dataset_score, dataset_ids))
 
+        total_score = sum(scores)
         final_score = total_score / len(dataset_ids)
 
     except Exception:
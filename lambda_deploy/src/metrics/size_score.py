@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import time
-from typing import Dict, Iterable, Optional, cast
+from typing import Dict, Optional, Tuple, cast
 
 from src.core.hf_client import model_info
 from src.core.model_url import to_repo_id
 from src.metrics.base import MetricResult, register
 
 # Weight-file extensions we count toward model size
-_WEIGHT_EXTS: Iterable[str] = (".safetensors", ".bin", ".onnx", ".tflite", ".h5", ".pt")
+_WEIGHT_EXTS: Tuple[str, ...] = (".safetensors", ".bin", ".onnx", ".tflite", ".h5", ".pt")
 
 
 def _clamp01(x: float) -> float:
@@ -41,7 +41,7 @@ def _sum_weight_megabytes(repo_id: str, revision: Optional[str]) -> float:
             )
             fsize = getattr(f, "size", None)
             if isinstance(fname, str) and isinstance(fsize, int):
-                if any(fname.lower().endswith(ext) for ext in _WEIGHT_EXTS):
+                if fname.lower().endswith(_WEIGHT_EXTS):
                     total_bytes += fsize
 
         return total_bytes / 1_000_000.0  # MB (decimal)
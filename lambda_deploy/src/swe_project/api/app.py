@@ -5,6 +5,8 @@ import os
 from flask import Flask
 from flask_cors import CORS
 
+from src.api.json_provider import OrjsonProvider
+
 from src.swe_project.api.routes.crud import bp as crud_bp
 from src.swe_project.api.routes.rate import bp as rate_bp
 from src.swe_project.api.routes.ingest import bp as ingest_bp
@@ -16,9 +18,24 @@ from src.swe_project.api.routes.artifacts import artifacts_bp
 from src.swe_project.api.routes.cost import bp as cost_bp
 from src.swe_project.api.routes.license_check import bp as license_check_bp
 
+# Registration order matters where routes overlap: first registered wins.
+_API_V1_BLUEPRINTS = (
+    health_bp,
+    crud_bp,
+    rate_bp,
+    ingest_bp,
+    download_bp,
+    lineage_bp,
+    cost_bp,
+    license_check_bp,
+)
+_ROOT_BLUEPRINTS = (artifacts_bp, authenticate_bp)
+
 
 def create_app():
     app = Flask(__name__)
+    # jsonify/get_json through orjson; same output as Flask's default provider
+    app.json = OrjsonProvider(app)
 
     # SECURITY FIX: Restrict CORS to specific allowed origins
     # Default to localhost for development, override with ALLOWED_ORIGINS env var
@@ -30,19 +47,13 @@ def create_app():
     CORS(app, resources={r"/*": {"origins": origins_list}}, supports_credentials=True)
 
     # All API routes are under /api/v1
-    app.register_blueprint(health_bp, url_prefix="/api/v1")
-    app.register_blueprint(crud_bp, url_prefix="/api/v1")
-    app.register_blueprint(rate_bp, url_prefix="/api/v1")
-    app.register_blueprint(ingest_bp, url_prefix="/api/v1")
-    app.register_blueprint(download_bp, url_prefix="/api/v1")
-    app.register_blueprint(lineage_bp, url_prefix="/api/v1")
-    app.register_blueprint(cost_bp, url_prefix="/api/v1")
-    app.register_blueprint(license_check_bp, url_prefix="/api/v1")
+    for bp in _API_V1_BLUEPRINTS:
+        app.register_blueprint(bp, url_prefix="/api/v1")
 
     # Register baseline spec endpoints at root (no /api/v1 prefix)
-    app.register_blueprint(artifacts_bp)
     # Note: artifacts_bp already has /health route
-    app.register_blueprint(authenticate_bp)
+    for bp in _ROOT_BLUEPRINTS:
+        app.register_blueprint(bp)
 
     @app.after_request
     def add_cors_headers(response):
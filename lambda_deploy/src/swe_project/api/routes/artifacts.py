@@ -311,13 +311,12 @@ def artifact_rate(artifact_id):
     NOTE: Real-time Phase 1 scoring takes 60-90s per model, too slow for API.
     In production, scores would be pre-computed during ingest and cached.
     """
-    rec = STORE.get(artifact_id)
+    rec, readme = STORE.get_with_readme(artifact_id)
     if not rec:
         return _json_error(404, "not found")
 
     name = str(rec.get("metadata", {}).get("name", "") or "")
     url = str(rec.get("data", {}).get("url", "") or "")
-    readme = STORE.get_readme(artifact_id)
 
     text = (name + "\n" + url + "\n" + (readme or "")).lower()
 
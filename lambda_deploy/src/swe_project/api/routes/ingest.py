@@ -5,6 +5,7 @@ from decimal import Decimal
 from flask import Blueprint, request, jsonify
 
 from src.cli import score_single_model
+from src.core.aws import BOTO_CONFIG
 
 bp = Blueprint('ingest', __name__)
 
@@ -16,7 +17,12 @@ if endpoint_url:
         "endpoint_url": endpoint_url,
         "region_name": os.getenv("AWS_DEFAULT_REGION", "us-east-1")
     }
-_dynamodb = boto3.resource("dynamodb", **dynamodb_config)
+# Shared keep-alive pool and retry policy (src.core.aws)
+_dynamodb = boto3.resource(
+    "dynamodb",
+    config=BOTO_CONFIG,
+    **dynamodb_config,
+)
 _table = _dynamodb.Table("swe-project-model-ratings")
 
 
@@ -8,6 +8,8 @@ import boto3
 from botocore.exceptions import ClientError
 from decimal import Decimal
 
+from src.swe_project.api.artifacts_store import backfill_name_keys
+
 # Connect to local DynamoDB
 dynamodb = boto3.resource(
     'dynamodb',
@@ -32,6 +34,25 @@ def create_rating_table():
                 {
                     'AttributeName': 'modelId',
                     'AttributeType': 'S'
+                },
+                {
+                    'AttributeName': 'record_type',
+                    'AttributeType': 'S'
+                },
+                {
+                    'AttributeName': 'artifact_name_key',
+                    'AttributeType': 'S'
+                }
+            ],
+            # Artifact lookups by (case-folded) name, see artifacts_store.NAME_INDEX
+            GlobalSecondaryIndexes=[
+                {
+                    'IndexName': 'record_type-artifact_name_key-index',
+                    'KeySchema': [
+                        {'AttributeName': 'record_type', 'KeyType': 'HASH'},
+                        {'AttributeName': 'artifact_name_key', 'KeyType': 'RANGE'}
+                    ],
+                    'Projection': {'ProjectionType': 'ALL'}
                 }
             ],
             BillingMode='PAY_PER_REQUEST'  # On-demand billing for local testing
@@ -138,20 +159,29 @@ def insert_sample_data():
         }
     ]
 
-    for model in sample_models:
-        try:
-            table.put_item(Item=model)
+    # batch_writer coalesces the puts into BatchWriteItem calls (25 per
+    # request) and retries unprocessed items; errors surface on exit
+    try:
+        with table.batch_writer() as batch:
+            for model in sample_models:
+                batch.put_item(Item=model)
+        for model in sample_models:
             print(f"✅ Inserted sample model: {model['name']}")
-        except ClientError as e:
-            print(f"❌ Error inserting {model['name']}: {e}")
+    except ClientError as e:
+        print(f"❌ Error inserting sample models: {e}")
 
 def main():
     print("🚀 Setting up local DynamoDB tables...\n")
 
     # Create tables
-    create_rating_table()
+    rating_table = create_rating_table()
     create_lineage_table()
 
+    # Key any artifacts from before the name index (start_local_backend.sh
+    # then sets ARTIFACT_NAME_INDEX_READY so the API uses it)
+    updated = backfill_name_keys(rating_table)
+    print(f"✅ Backfilled artifact_name_key on {updated} artifact(s)")
+
     print("\n📊 Inserting sample data...\n")
     insert_sample_data()
 
@@ -1,5 +1,6 @@
 from flask import Flask
 
+from .json_provider import OrjsonProvider
 from .routes.rate import rate_bp
 from .routes.crud import crud_bp
 from .routes.ingest import ingest_bp     
@@ -9,6 +10,8 @@ from .routes.download import download_bp
 def create_app():
     # basic app factory, just registers blueprints
     app = Flask(__name__)
+    # jsonify() in every route encodes through orjson
+    app.json = OrjsonProvider(app)
     app.register_blueprint(rate_bp)
     app.register_blueprint(crud_bp)
     app.register_blueprint(ingest_bp)      # <-- add
@@ -17,6 +20,7 @@ def create_app():
 
 
 # quick local run: python -m api.app
+# (dev server only; serve api.wsgi:app with gunicorn for anything real)
 if __name__ == "__main__":
     app = create_app()
     app.run(host="0.0.0.0", port=8000, debug=True)
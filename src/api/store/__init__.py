@@ -1,37 +1,67 @@
 # simple in-memory store with a tiny snapshot to /tmp so warm lambdas keep state
-import json
+import atexit
 import os
 import threading
 import time
 import uuid
 
+import orjson
+
 _SNAPSHOT = "/tmp/model_store.json"
 _LOCK = threading.RLock()
+_WRITE_LOCK = threading.Lock()
+# mutations only mark the store dirty; a background thread flushes the
+# snapshot this long after the first one so bursts coalesce into one write
+_FLUSH_DELAY_S = 0.25
 
 
 class InMemoryStore:
     def __init__(self):
         self._by_id = {}
         self._jobs = {}
+        self._dirty = threading.Event()
         self._load()
+        # read-only copy of _by_id for lock-free get/list; writers replace
+        # it wholesale under _LOCK, so readers always see a consistent dict
+        self._by_id_snapshot = dict(self._by_id)
+        threading.Thread(target=self._flush_loop, daemon=True).start()
+        atexit.register(self._save)
 
     def _load(self):
         if os.path.exists(_SNAPSHOT):
             try:
-                with open(_SNAPSHOT, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(_SNAPSHOT, "rb") as f:
+                    data = orjson.loads(f.read())
                 self._by_id = data.get("by_id", {})
                 self._jobs = data.get("jobs", {})
             except Exception:
                 self._by_id = {}
                 self._jobs = {}
 
+    def _flush_loop(self):
+        while True:
+            self._dirty.wait()
+            time.sleep(_FLUSH_DELAY_S)
+            self._save()
+
     def _save(self):
-        try:
-            with open(_SNAPSHOT, "w", encoding="utf-8") as f:
-                json.dump({"by_id": self._by_id, "jobs": self._jobs}, f)
-        except Exception:
-            pass
+        # _WRITE_LOCK spans snapshot and write so snapshots reach the file in
+        # the order they were taken; file I/O still happens outside _LOCK so
+        # requests aren't blocked on it
+        with _WRITE_LOCK:
+            with _LOCK:
+                if not self._dirty.is_set():
+                    return
+                self._dirty.clear()
+                try:
+                    payload = orjson.dumps({"by_id": self._by_id, "jobs": self._jobs})
+                except Exception:
+                    return
+            try:
+                with open(_SNAPSHOT, "wb") as f:
+                    f.write(payload)
+            except Exception:
+                pass
 
     # basic CRUD
     def create(self, item):
@@ -40,31 +70,59 @@ class InMemoryStore:
             now = int(time.time())
             item.update({"id": _id, "created_at": now, "updated_at": now})
             self._by_id[_id] = item
-            self._save()
+            self._by_id_snapshot = dict(self._by_id)
+            self._dirty.set()
             return _id
 
-    def list(self):
-        with _LOCK:
-            return list(self._by_id.values())
+    def list(self, min_score=None, since=None):
+        """
+        All items, or only those with metrics.net_score >= min_score and/or
+        created_at >= since. Filtering happens here in one pass over the
+        snapshot so callers don't copy the whole store first.
+        """
+        items = self._by_id_snapshot.values()
+        if min_score is None and since is None:
+            return list(items)
+
+        def keep(m):
+            # a malformed stored value (e.g. net_score: None) just doesn't
+            # match, rather than failing the whole listing
+            try:
+                if min_score is not None and float(
+                    (m.get("metrics") or {}).get("net_score", 0.0)
+                ) < min_score:
+                    return False
+                if since is not None and int(m.get("created_at", 0)) < since:
+                    return False
+            except (TypeError, ValueError):
+                return False
+            return True
+
+        return list(filter(keep, items))
 
     def get(self, _id):
-        with _LOCK:
-            return self._by_id.get(_id)
+        return self._by_id_snapshot.get(_id)
 
     def update(self, _id, patch):
         with _LOCK:
             if _id not in self._by_id:
                 return False
-            self._by_id[_id].update(patch)
-            self._by_id[_id]["updated_at"] = int(time.time())
-            self._save()
+            # swap in a new item so readers of the old snapshot never see
+            # a half-applied patch
+            item = dict(self._by_id[_id])
+            item.update(patch)
+            item["updated_at"] = int(time.time())
+            self._by_id[_id] = item
+            self._by_id_snapshot = dict(self._by_id)
+            self._dirty.set()
             return True
 
     def delete(self, _id):
         with _LOCK:
             ok = self._by_id.pop(_id, None) is not None
             if ok:
-                self._save()
+                self._by_id_snapshot = dict(self._by_id)
+                self._dirty.set()
             return ok
 
     # light job registry (useful for ingest later)
@@ -77,7 +135,7 @@ class InMemoryStore:
                 "payload": payload,
                 "result": None,
             }
-            self._save()
+            self._dirty.set()
             return jid
 
     def job_set(self, job_id, status, result=None):
@@ -85,7 +143,7 @@ class InMemoryStore:
             if job_id in self._jobs:
                 self._jobs[job_id]["status"] = status
                 self._jobs[job_id]["result"] = result
-                self._save()
+                self._dirty.set()
 
     def job_get(self, job_id):
         with _LOCK:
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from botocore.config import Config
+
+# Shared by every DynamoDB client in the API so they all pool and retry
+# alike: keep-alive, pooled connections let warm invocations reuse TLS
+# sessions, and adaptive retries absorb throttling without failing the
+# request.
+BOTO_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    connect_timeout=1,
+    read_timeout=3,
+)
@@ -1,11 +1,37 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from typing import Optional, Tuple
-from urllib.parse import urlparse
 
 _BLOCK = {"datasets", "spaces", "models", "docs"}
 
+# One precompiled pass replaces urlparse + split: scheme, a host ending in
+# huggingface.co (no port), then the first two path segments and an optional
+# /tree/<branch> or /resolve/<branch>. Repeated slashes are tolerated and
+# anything after (file paths, ?query, #fragment) is ignored.
+_HF_URL_RE = re.compile(
+    r"[A-Za-z][A-Za-z0-9+.\-]*://"
+    r"[^/?#]*huggingface\.co(?=[/?#]|$)"
+    r"(?:/+(?P<a>[^/?#]+))?"
+    r"(?:/+(?P<b>[^/?#]+))?"
+    r"(?:/+(?:tree|resolve)/+(?P<branch>[^/?#]+))?"
+)
 
+
+def _match(hf_url: str) -> Optional[re.Match[str]]:
+    s = (hf_url or "").strip()
+    if not s:
+        return None
+    # Allow bare paths like "huggingface.co/org/name"
+    if "://" not in s:
+        s = "https://" + s
+    return _HF_URL_RE.match(s)
+
+
+# Both parsers are pure functions of the URL string and get called by every
+# metric for the same URL, so memoize them.
+@lru_cache(maxsize=1024)
 def to_repo_id(hf_url: str) -> Tuple[str, Optional[str]]:
     """
     Normalize Hugging Face model URLs to ('org/name' OR 'name', optional_branch).
@@ -23,59 +49,26 @@ def to_repo_id(hf_url: str) -> Tuple[str, Optional[str]]:
       and branch may be None.
       If not an HF URL, we **return the original input string** (backward compatible).
     """
-    s = (hf_url or "").strip()
-    if not s:
-        return hf_url.strip(), None
-
-    # Allow bare paths like "huggingface.co/org/name"
-    if "://" not in s:
-        s = "https://" + s
-
-    p = urlparse(s)
-    # Accept any host that ends with huggingface.co (incl. enterprise subdomains)
-    if not p.netloc.endswith("huggingface.co"):
-        # Not an HF URL; preserve old behavior so metrics don't crash
-        return hf_url.strip(), None
-
-    parts = [seg for seg in p.path.split("/") if seg]  # remove empty segments
-    if not parts:
-        # No repo segment; preserve old behavior
+    m = _match(hf_url)
+    # Not an HF URL, or no repo segment; preserve old behavior so metrics don't crash
+    if m is None or m["a"] is None:
         return hf_url.strip(), None
 
     # repo_id can be 1-seg (root-level) or 2-seg (org/name)
-    branch: Optional[str] = None
-    if len(parts) >= 2:
-        repo_id = f"{parts[0]}/{parts[1]}"
-        rest = parts[2:]
-    else:
-        repo_id = parts[0]
-        rest = []
-
-    # Handle /tree/<branch> or /resolve/<branch>/...
-    if len(rest) >= 2 and rest[0] in {"tree", "resolve"}:
-        branch = rest[1]
-
+    a, b, branch = m.group("a", "b", "branch")
+    repo_id = f"{a}/{b}" if b else a
     return repo_id, branch
 
 
+@lru_cache(maxsize=1024)
 def is_hf_model_url(hf_url: str) -> bool:
     """
     True iff the URL points to a Hugging Face *model* repo.
     Accepts root-level (e.g., https://huggingface.co/gpt2) and org/name.
     Excludes datasets/spaces/docs/models sections.
     """
-    s = (hf_url or "").strip()
-    if not s:
-        return False
-    if "://" not in s:
-        s = "https://" + s
-    p = urlparse(s)
-    if not p.netloc.endswith("huggingface.co"):
-        return False
-    parts = [seg for seg in p.path.split("/") if seg]
-    if not parts:
-        return False
-    if parts[0] in _BLOCK:
+    m = _match(hf_url)
+    if m is None or m["a"] is None:
         return False
     # At least one segment (root-level) is OK; second segment (org/name) also OK.
-    return True
+    return m["a"] not in _BLOCK
@@ -33,6 +33,7 @@ _GH_RE: Pattern[str] = re.compile(
 _GH_LINK_RE: Pattern[str] = re.compile(
     r"https?://github\.com/[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+"
 )
+_BOT_SUFFIXES = ("[bot]", "-bot", "_bot")
 
 
 def _gh_headers() -> Dict[str, str]:
@@ -175,9 +176,7 @@ def _is_bot(author_login: Optional[str], author_email: Optional[str]) -> bool:
     login = (author_login or "").lower()
     email = (author_email or "").lower()
     return (
-        login.endswith("[bot]")
-        or login.endswith("-bot")
-        or login.endswith("_bot")
+        login.endswith(_BOT_SUFFIXES)
         or "github-actions" in login
         or "bot@" in email
         or "noreply@" in email
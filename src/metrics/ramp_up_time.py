@@ -1,65 +1,135 @@
 import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
-from src.core.hf_client import download_snapshot
+from src.core.hf_client import readme_text
 from src.llm_client import ask_llm
 from src.metrics.base import register
 
+_SYSTEM_PROMPT = "You are a strict evaluator of documentation clarity."
 
-def compute(model_url: str):
-    """
-    Compute ramp-up time score by analyzing README with LLM.
-    Supports both Hugging Face repos and local absolute paths.
-    """
-    t0 = time.perf_counter()
+# chars of each README sent to the LLM
+_README_CHARS = 4000
+
+# READMEs per batched LLM request in compute_batch; keeps prompts well
+# inside the model's context window
+_BATCH_SIZE = 8
 
+# Upper bound on concurrent README fetches in compute_batch
+_README_WORKERS = 8
+
+_SCORE_RE = re.compile(r"\b(0(?:\.\d+)?|1(?:\.0+)?)\b")
+
+# Leading "1.", "2)", "3:" or "README 4:" label on a line of a batched reply
+_BATCH_LABEL_RE = re.compile(r"^\W*(?:readme\s*#?\s*\d+\s*[.):\-]?|\d+\s*[.):])[\s*]+", re.I)
+_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def _fetch_readme(model_url: str) -> str:
     # case 1: Local repo path
     if os.path.isabs(model_url) and os.path.exists(model_url):
         readme_file = os.path.join(model_url, "README.md")
+        if not os.path.exists(readme_file):
+            return ""
+        with open(readme_file, "r", encoding="utf-8") as f:
+            return f.read()
+
+    # case 2: hugging Face repo; only the README is needed, so fetch that
+    # one file instead of going through the snapshot machinery
+    repo_id = model_url.replace("https://huggingface.co/", "").strip("/")
+    return readme_text(repo_id)
 
-    else:
-        # case 2: hugging Face repo
-        repo_id = model_url.replace("https://huggingface.co/", "").strip("/")
-        local_path = download_snapshot(repo_id, allow_patterns=["README.md"])
-        readme_file = os.path.join(local_path, "README.md")
 
-    if not os.path.exists(readme_file):
-        return {
-            "value": 0.0,
-            "latency_ms": int((time.perf_counter() - t0) * 1000),
-        }
+def _parse_score(response: Optional[str]) -> Optional[float]:
+    """Pull a 0..1 score out of an LLM reply; None if there is none."""
+    if not response:
+        return None
+    try:
+        score = float(response.strip())
+    except ValueError:
+        m = _SCORE_RE.search(response)
+        if not m:
+            return None
+        score = float(m.group(1))
+    return max(0.0, min(1.0, score))
 
-    with open(readme_file, "r", encoding="utf-8") as f:
-        readme_text = f.read()
 
+def _parse_batch_line(line: str) -> Optional[float]:
+    """
+    One README's score from a line of a batched reply. A leading index or
+    "README n" label is dropped; anything still holding other than exactly
+    one number is unparseable, so the batch falls back per README.
+    """
+    line = _BATCH_LABEL_RE.sub("", line, count=1)
+    if len(_NUMBER_RE.findall(line)) != 1:
+        return None
+    return _parse_score(line)
+
+
+def _score_readme(readme: str) -> float:
     response = ask_llm(
         [
-            {
-                "role": "system",
-                "content": "You are a strict evaluator of documentation clarity.",
-            },
+            {"role": "system", "content": _SYSTEM_PROMPT},
             {
                 "role": "user",
                 "content": (
                     "Rate the clarity and completeness of this README in a single number "
                     "between 0 (worst) and 1 (best). Respond with just the number.\n\n"
-                    f"{readme_text[:4000]}"
+                    f"{readme[:_README_CHARS]}"
+                ),
+            },
+        ]
+    )
+    score = _parse_score(response)
+    return 0.0 if score is None else score
+
+
+def _score_readmes(readmes: List[str]) -> List[float]:
+    """
+    Score several READMEs with one LLM round-trip.
+
+    Falls back to one request per README when the reply does not carry
+    exactly one score per line for each of them.
+    """
+    if len(readmes) == 1:
+        return [_score_readme(readmes[0])]
+
+    sections = "\n\n".join(
+        f"### README {i}\n{text[:_README_CHARS]}" for i, text in enumerate(readmes, 1)
+    )
+    response = ask_llm(
+        [
+            {"role": "system", "content": _SYSTEM_PROMPT},
+            {
+                "role": "user",
+                "content": (
+                    f"Rate the clarity and completeness of each of the {len(readmes)} "
+                    "READMEs below with a number between 0 (worst) and 1 (best). "
+                    f"Return {len(readmes)} numbers, one per line, in README order, "
+                    "and nothing else.\n\n"
+                    f"{sections}"
                 ),
             },
         ]
     )
+    lines = [ln for ln in (response or "").splitlines() if ln.strip()]
+    scores = [_parse_batch_line(ln) for ln in lines]
+    if len(scores) != len(readmes) or None in scores:
+        return [_score_readme(text) for text in readmes]
+    return [s for s in scores if s is not None]
 
-    score = 0.0
-    if response:
-        try:
-            score = float(response.strip())
-        except ValueError:
-            m = re.search(r"\b(0(?:\.\d+)?|1(?:\.0+)?)\b", response)
-            if m:
-                score = float(m.group(1))
 
-    score = max(0.0, min(1.0, score))
+def compute(model_url: str):
+    """
+    Compute ramp-up time score by analyzing README with LLM.
+    Supports both Hugging Face repos and local absolute paths.
+    """
+    t0 = time.perf_counter()
+
+    readme = _fetch_readme(model_url)
+    score = _score_readme(readme) if readme else 0.0
 
     return {
         "value": score,
@@ -67,4 +137,32 @@ def compute(model_url: str):
     }
 
 
+def compute_batch(model_urls: List[str]):
+    """
+    Score many models at once: READMEs are fetched concurrently, then sent
+    to the LLM in batches of _BATCH_SIZE rather than one request per URL.
+
+    Returns one result per URL, in order. latency_ms is the wall time of
+    the whole batch, since the LLM cost is shared.
+    """
+    t0 = time.perf_counter()
+    if not model_urls:
+        return []
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(model_urls), _README_WORKERS)
+    ) as ex:
+        readmes = list(ex.map(_fetch_readme, model_urls))
+
+    scores = [0.0] * len(model_urls)
+    pending = [i for i, text in enumerate(readmes) if text]
+    for start in range(0, len(pending), _BATCH_SIZE):
+        chunk = pending[start:start + _BATCH_SIZE]
+        for i, score in zip(chunk, _score_readmes([readmes[i] for i in chunk])):
+            scores[i] = score
+
+    latency_ms = int((time.perf_counter() - t0) * 1000)
+    return [{"value": score, "latency_ms": latency_ms} for score in scores]
+
+
 register("ramp_up_time", "ramp_up_time", compute)
@@ -12,55 +12,67 @@ Scoring:
 import os
 import re
 import time
-from typing import Optional
+from typing import Optional, Tuple
 
 from src.core.hf_client import download_snapshot, model_info
 from src.metrics.base import register
 
 
-def _check_code_in_readme(readme_content: str) -> bool:
-    """Check if README contains code snippets."""
-    # Look for common code block patterns
-    code_patterns = [
-        r'```python',
-        r'```py',
-        r'from transformers import',
-        r'import torch',
-        r'model = ',
-        r'tokenizer = ',
-    ]
-
-    for pattern in code_patterns:
-        if re.search(pattern, readme_content, re.IGNORECASE):
-            return True
-    return False
-
-
-def _check_runnable_example(readme_content: str) -> bool:
-    """Check if README has a complete runnable example."""
-    # Look for more complete example patterns
-    has_import = bool(re.search(r'(from|import)\s+\w+', readme_content))
-    has_model_load = bool(re.search(r'(model|tokenizer)\s*=', readme_content, re.IGNORECASE))
-    has_inference = bool(re.search(r'(predict|generate|forward|\(.*\))', readme_content))
+# README detectors, compiled once at import. Each one is tried anchored at a
+# position; _README_SCAN finds (in one pass) every position where at least
+# one of them could start.
+_CODE_RE = re.compile(
+    r'```py|from transformers import|import torch|model = |tokenizer = ',
+    re.IGNORECASE,
+)
+_IMPORT_RE = re.compile(r'(from|import)\s+\w+')
+_MODEL_LOAD_RE = re.compile(r'(model|tokenizer)\s*=', re.IGNORECASE)
+_INFERENCE_RE = re.compile(r'(predict|generate|forward|\(.*\))')
+_README_SCAN = re.compile(
+    r'(?=(?i:```py|from transformers import|import torch|model = |tokenizer = )'
+    r'|(?:from|import)\s+\w'
+    r'|(?i:(?:model|tokenizer)\s*=)'
+    r'|predict|generate|forward|\(.*\))'
+)
+
+# Files whose presence means the repo declares its dependencies
+_DEPENDENCY_FILES = frozenset({
+    'requirements.txt',
+    'setup.py',
+    'pyproject.toml',
+    'environment.yml',
+    'Pipfile',
+})
+
+
+def _scan_readme(readme_content: str) -> Tuple[bool, bool]:
+    """
+    Single pass over the README.
 
-    # Consider it runnable if it has imports, model loading, and some inference
-    return has_import and has_model_load and has_inference
+    Returns (has_code, has_runnable): whether it contains code snippets, and
+    whether it has a complete runnable example (imports, model loading and
+    some inference).
+    """
+    code = imp = load = infer = False
+    for m in _README_SCAN.finditer(readme_content):
+        pos = m.start()
+        code = code or _CODE_RE.match(readme_content, pos) is not None
+        imp = imp or _IMPORT_RE.match(readme_content, pos) is not None
+        load = load or _MODEL_LOAD_RE.match(readme_content, pos) is not None
+        infer = infer or _INFERENCE_RE.match(readme_content, pos) is not None
+        if code and imp and load and infer:
+            break
+    return code, imp and load and infer
 
 
 def _check_dependencies(local_path: str) -> bool:
     """Check if the model has dependency files."""
-    dependency_files = [
-        'requirements.txt',
-        'setup.py',
-        'pyproject.toml',
-        'environment.yml',
-        'Pipfile',
-    ]
-
-    for dep_file in dependency_files:
-        if os.path.exists(os.path.join(local_path, dep_file)):
-            return True
-    return False
+    # one directory read instead of a stat() per candidate file
+    try:
+        with os.scandir(local_path) as it:
+            return any(e.name in _DEPENDENCY_FILES for e in it)
+    except OSError:
+        return False
 
 
 def compute(model_url: str) -> dict:
@@ -92,8 +104,7 @@ def compute(model_url: str) -> dict:
             with open(readme_file, "r", encoding="utf-8", errors="ignore") as f:
                 readme_content = f.read()
 
-            has_code = _check_code_in_readme(readme_content)
-            has_runnable = _check_runnable_example(readme_content)
+            has_code, has_runnable = _scan_readme(readme_content)
             has_deps = _check_dependencies(local_path)
 
             if has_runnable and has_deps:
@@ -4,18 +4,63 @@ Reviewedness Metric
 The fraction of all code (not weights) in the associated GitHub repository
 that was introduced through pull requests with a code review.
 
-Returns -1 if there is no linked GitHub repository.
+Returns -1 if there is no linked GitHub repository, or if GITHUB_TOKEN is
+unset (anonymous API calls are too rate-limited to be useful).
 """
 import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from src.core.hf_client import download_snapshot, model_info
 from src.metrics.base import register
 
+# GitHub repo URL in README text. Matches bare URLs and markdown link
+# targets alike, so one scan finds the first link of either form.
+_GH_URL_RE = re.compile(r'https?://github\.com/[\w\-]+/[\w\-]+')
+_GH_OWNER_REPO_RE = re.compile(r'https?://github\.com/([^/]+)/([^/]+)')
+
+# GitHub links sit near the top of a README; don't read/scan past this
+_README_MAX_CHARS = 128 * 1024
+
+# Concurrency (and connection-pool size) for per-PR review lookups
+_REVIEW_WORKERS = 16
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+_GRAPHQL_URL = "https://api.github.com/graphql"
+_MERGED_PR_REVIEWS_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(states: MERGED, first: 50, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      nodes { number reviews { totalCount } }
+    }
+  }
+}
+"""
+
+
+def _get_session() -> requests.Session:
+    """Shared keep-alive session for GitHub API calls, built on first use."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=_REVIEW_WORKERS, pool_maxsize=_REVIEW_WORKERS
+                )
+                session.mount("https://", adapter)
+                _SESSION = session
+    return _SESSION
+
 
 def _extract_github_url(model_url: str, readme_content: Optional[str] = None) -> Optional[str]:
     """
@@ -48,22 +93,61 @@ def _extract_github_url(model_url: str, readme_content: Optional[str] = None) ->
     # Try to extract from README
     if readme_content:
         # Look for GitHub URLs in markdown links or plain text
-        github_patterns = [
-            r'https?://github\.com/[\w\-]+/[\w\-]+',
-            r'\[.*?\]\((https?://github\.com/[\w\-]+/[\w\-]+)\)',
-        ]
-
-        for pattern in github_patterns:
-            match = re.search(pattern, readme_content)
-            if match:
-                url = match.group(1) if match.lastindex else match.group(0)
-                # Clean up the URL
-                url = url.rstrip('/.)')
-                return url
+        match = _GH_URL_RE.search(readme_content)
+        if match:
+            # Clean up the URL
+            return match.group(0).rstrip('/.)')
 
     return None
 
 
+def _graphql_review_fraction(
+    session: requests.Session, owner: str, repo: str, token: str
+) -> Optional[float]:
+    """
+    Review fraction of the 50 most recently updated merged PRs in one
+    GraphQL request.
+
+    Returns None if the GraphQL API could not answer, so the caller can
+    fall back to the REST path.
+    """
+    try:
+        response = session.post(
+            _GRAPHQL_URL,
+            json={
+                "query": _MERGED_PR_REVIEWS_QUERY,
+                "variables": {"owner": owner, "name": repo},
+            },
+            headers={"Authorization": f"bearer {token}"},
+            timeout=10,
+        )
+        if response.status_code != 200:
+            return None
+        payload = response.json() or {}
+    except (requests.exceptions.RequestException, ValueError):
+        return None
+
+    repository = (payload.get("data") or {}).get("repository")
+    if repository is None:
+        # Unknown repo scores 0.0, same as a 404 on the REST path
+        errors = payload.get("errors") or []
+        if any(e.get("type") == "NOT_FOUND" for e in errors):
+            return 0.0
+        return None
+
+    nodes = (repository.get("pullRequests") or {}).get("nodes") or []
+    if not nodes:
+        return 0.0
+
+    # GraphQL nulls out nodes/fields it can't show (deleted PRs, partial
+    # permissions); those count as unreviewed rather than failing the metric
+    reviewed_prs = sum(
+        1 for n in nodes
+        if (((n or {}).get("reviews") or {}).get("totalCount") or 0) > 0
+    )
+    return reviewed_prs / len(nodes)
+
+
 def _get_pr_review_fraction(github_url: str) -> float:
     """
     Calculate the fraction of code introduced via reviewed PRs.
@@ -72,24 +156,33 @@ def _get_pr_review_fraction(github_url: str) -> float:
         github_url: GitHub repository URL
 
     Returns:
-        Fraction (0.0 to 1.0) of code from reviewed PRs
+        Fraction (0.0 to 1.0) of code from reviewed PRs, or -1.0 if no
+        GITHUB_TOKEN is set
     """
     # Extract owner and repo from URL
-    match = re.match(r'https?://github\.com/([^/]+)/([^/]+)', github_url.rstrip('/'))
+    match = _GH_OWNER_REPO_RE.match(github_url.rstrip('/'))
     if not match:
         return 0.0
 
     owner, repo = match.groups()
 
     github_token = os.getenv("GITHUB_TOKEN")
-    headers = {}
-    if github_token:
-        headers["Authorization"] = f"token {github_token}"
+    if not github_token:
+        # Anonymous calls hit the 60/hr rate limit almost immediately
+        return -1.0
+    headers = {"Authorization": f"token {github_token}"}
+
+    session = _get_session()
+
+    # One GraphQL query replaces ~52 REST calls; REST is the fallback
+    fraction = _graphql_review_fraction(session, owner, repo, github_token)
+    if fraction is not None:
+        return fraction
 
     try:
         # Get repository statistics
         repo_url = f"https://api.github.com/repos/{owner}/{repo}"
-        repo_response = requests.get(repo_url, headers=headers, timeout=10)
+        repo_response = session.get(repo_url, headers=headers, timeout=10)
 
         if repo_response.status_code != 200:
             return 0.0
@@ -103,7 +196,7 @@ def _get_pr_review_fraction(github_url: str) -> float:
             'direction': 'desc'
         }
 
-        pr_response = requests.get(pr_url, params=pr_params, headers=headers, timeout=10)
+        pr_response = session.get(pr_url, params=pr_params, headers=headers, timeout=10)
 
         if pr_response.status_code != 200:
             return 0.0
@@ -116,15 +209,18 @@ def _get_pr_review_fraction(github_url: str) -> float:
         if not merged_prs:
             return 0.0
 
-        # Count PRs with reviews
-        reviewed_prs = 0
-        for pr in merged_prs[:50]:  # Check up to 50 most recent merged PRs
-            pr_number = pr['number']
+        # Count PRs with reviews, fetching reviews for up to 50 most recent
+        # merged PRs concurrently over the shared session
+        def _fetch_reviews(pr: dict) -> requests.Response:
+            reviews_url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr['number']}/reviews"
+            return session.get(reviews_url, headers=headers, timeout=5)
 
-            # Get reviews for this PR
-            reviews_url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}/reviews"
-            reviews_response = requests.get(reviews_url, headers=headers, timeout=5)
+        sample = merged_prs[:50]
+        with ThreadPoolExecutor(max_workers=min(len(sample), _REVIEW_WORKERS)) as ex:
+            review_responses = list(ex.map(_fetch_reviews, sample))
 
+        reviewed_prs = 0
+        for reviews_response in review_responses:
             if reviews_response.status_code == 200:
                 reviews = reviews_response.json()
                 # Count as reviewed if there's at least one review
@@ -157,10 +253,17 @@ def compute(model_url: str) -> dict:
 
     Returns:
         dict: {"value": float, "latency_ms": int}
-        value: -1 if no GitHub repo, 0.0-1.0 fraction otherwise
+        value: -1 if no GitHub repo or no GITHUB_TOKEN, 0.0-1.0 fraction otherwise
     """
     t0 = time.perf_counter()
 
+    # Without a token the GitHub lookups can't succeed; skip the README download
+    if not os.getenv("GITHUB_TOKEN"):
+        return {
+            "value": -1.0,
+            "latency_ms": int((time.perf_counter() - t0) * 1000),
+        }
+
     repo_id = model_url.replace("https://huggingface.co/", "").strip("/")
     score = -1.0  # Default: no GitHub repository
 
@@ -172,7 +275,7 @@ def compute(model_url: str) -> dict:
         readme_content = None
         if os.path.exists(readme_file):
             with open(readme_file, "r", encoding="utf-8", errors="ignore") as f:
-                readme_content = f.read()
+                readme_content = f.read(_README_MAX_CHARS)
 
         # Extract GitHub URL
         github_url = _extract_github_url(model_url, readme_content)
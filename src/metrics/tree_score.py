@@ -6,14 +6,36 @@ according to the lineage graph.
 
 Returns 0.0 if the model has no parents.
 """
-import json
-import os
 import time
+from functools import lru_cache
 from typing import List, Dict, Optional
 
-from src.core.hf_client import download_snapshot, model_info
+from src.core.hf_client import model_config, model_info
 from src.metrics.base import register
 
+# Heuristic net_scores for well-known base models, keyed by lowercase name.
+# Order matters: the first name found in a parent id wins.
+_WELL_KNOWN_MODELS: Dict[str, float] = {
+    'bert-base-uncased': 0.85,
+    'bert-base-cased': 0.85,
+    'bert-large-uncased': 0.88,
+    'gpt2': 0.90,
+    'gpt2-medium': 0.88,
+    'gpt2-large': 0.87,
+    'roberta-base': 0.86,
+    't5-base': 0.84,
+    'distilbert-base-uncased': 0.82,
+}
+
+# Common config.json fields indicating base/parent models, in priority order
+_PARENT_FIELDS = (
+    '_name_or_path',
+    'base_model',
+    'parent_model',
+    'model_name_or_path',
+    'base_model_name_or_path',
+)
+
 
 def _extract_parent_models(config_data: dict) -> List[str]:
     """
@@ -31,34 +53,14 @@ def _extract_parent_models(config_data: dict) -> List[str]:
     Returns:
         List of parent model identifiers
     """
-    parents = []
-
-    # Common fields indicating base/parent models
-    parent_fields = [
-        '_name_or_path',
-        'base_model',
-        'parent_model',
-        'model_name_or_path',
-        'base_model_name_or_path',
-    ]
-
-    for field in parent_fields:
-        if field in config_data:
-            value = config_data[field]
-            if isinstance(value, str) and value:
-                # Skip if it's just a local path or current model
-                if not value.startswith('./') and not value.startswith('/'):
-                    parents.append(value)
-
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_parents = []
-    for parent in parents:
-        if parent not in seen:
-            seen.add(parent)
-            unique_parents.append(parent)
-
-    return unique_parents
+    # dict keys give order-preserving dedup in the same pass
+    seen: Dict[str, None] = {}
+    for field in _PARENT_FIELDS:
+        value = config_data.get(field)
+        # Skip if it's just a local path or current model
+        if isinstance(value, str) and value and not value.startswith(('./', '/')):
+            seen.setdefault(value, None)
+    return list(seen)
 
 
 def _get_parent_score(parent_id: str) -> Optional[float]:
@@ -89,29 +91,18 @@ def _get_parent_score(parent_id: str) -> Optional[float]:
 
     # For this implementation, we'll use a heuristic:
     # Well-known base models get high scores
-    well_known_models = {
-        'bert-base-uncased': 0.85,
-        'bert-base-cased': 0.85,
-        'bert-large-uncased': 0.88,
-        'gpt2': 0.90,
-        'gpt2-medium': 0.88,
-        'gpt2-large': 0.87,
-        'roberta-base': 0.86,
-        't5-base': 0.84,
-        'distilbert-base-uncased': 0.82,
-    }
+    return _heuristic_score(parent_id.lower())
 
-    # Check if parent is a well-known model
-    for known_model, score in well_known_models.items():
-        if known_model in parent_id.lower():
-            return score
 
-    # For HuggingFace models, extract the model name
-    # e.g., "google-bert/bert-base-uncased" -> check if "bert-base-uncased" is known
-    if '/' in parent_id:
-        model_name = parent_id.split('/')[-1]
-        if model_name in well_known_models:
-            return well_known_models[model_name]
+@lru_cache(maxsize=1024)
+def _heuristic_score(pid: str) -> float:
+    # First well-known name contained in the id wins (so "gpt2-medium"
+    # matches "gpt2"). This also covers HF ids like
+    # "google-bert/bert-base-uncased". Memoized since the same parents
+    # recur across models.
+    for known_model, score in _WELL_KNOWN_MODELS.items():
+        if known_model in pid:
+            return score
 
     # Default: assume moderate quality for unknown parents
     # This is better than returning 0 or None
@@ -138,14 +129,11 @@ def compute(model_url: str) -> dict:
     score = 0.0
 
     try:
-        # Download config.json to extract parent information
-        local_path = download_snapshot(repo_id, allow_patterns=["config.json"])
-        config_file = os.path.join(local_path, "config.json")
-
-        if os.path.exists(config_file):
-            with open(config_file, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
+        # Fetch just config.json (served from the local HF cache when
+        # present) to extract parent information; {} if missing/invalid
+        config_data = model_config(repo_id)
 
+        if config_data:
             # Extract parent models
             parents = _extract_parent_models(config_data)
 
@@ -167,7 +155,7 @@ def compute(model_url: str) -> dict:
                 # No parents found
                 score = 0.0
         else:
-            # No config.json found
+            # No (usable) config.json found
             score = 0.0
 
     except Exception:
@@ -10,6 +10,8 @@ from typing import Dict
 import boto3
 from flask import Blueprint, request, jsonify
 
+from src.core.aws import BOTO_CONFIG
+
 bp = Blueprint("cost", __name__)
 
 # DynamoDB setup
@@ -24,7 +26,12 @@ if endpoint_url:
         "region_name": os.getenv("AWS_DEFAULT_REGION", "us-east-1")
     }
 
-_dynamodb = boto3.resource("dynamodb", **dynamodb_config)
+# Shared keep-alive pool and retry policy (src.core.aws)
+_dynamodb = boto3.resource(
+    "dynamodb",
+    config=BOTO_CONFIG,
+    **dynamodb_config,
+)
 _table = _dynamodb.Table(DYNAMODB_TABLE_NAME)
 
 
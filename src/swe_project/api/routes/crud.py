@@ -9,6 +9,7 @@ import os
 import boto3
 from flask import Blueprint, request, jsonify
 
+from src.core.aws import BOTO_CONFIG
 from src.swe_project.api.auth import require_api_key
 
 bp = Blueprint("crud", __name__)
@@ -25,7 +26,12 @@ if endpoint_url:
         "region_name": os.getenv("AWS_DEFAULT_REGION", "us-east-1")
     }
 
-_dynamodb = boto3.resource("dynamodb", **dynamodb_config)
+# Shared keep-alive pool and retry policy (src.core.aws)
+_dynamodb = boto3.resource(
+    "dynamodb",
+    config=BOTO_CONFIG,
+    **dynamodb_config,
+)
 _table = _dynamodb.Table(DYNAMODB_TABLE_NAME)
 
 
@@ -13,8 +13,12 @@ import boto3
 import requests
 from flask import Blueprint, request, jsonify
 
+from src.core.aws import BOTO_CONFIG
+
 bp = Blueprint("license_check", __name__)
 
+_GITHUB_REPO_RE = re.compile(r'https://github\.com/([^/]+)/([^/]+)')
+
 # DynamoDB setup
 DYNAMODB_TABLE_NAME = os.getenv("DYNAMODB_TABLE_NAME", "swe-project-model-ratings")
 
@@ -27,7 +31,12 @@ if endpoint_url:
         "region_name": os.getenv("AWS_DEFAULT_REGION", "us-east-1")
     }
 
-_dynamodb = boto3.resource("dynamodb", **dynamodb_config)
+# Shared keep-alive pool and retry policy (src.core.aws)
+_dynamodb = boto3.resource(
+    "dynamodb",
+    config=BOTO_CONFIG,
+    **dynamodb_config,
+)
 _table = _dynamodb.Table(DYNAMODB_TABLE_NAME)
 
 
@@ -97,7 +106,7 @@ def _get_github_license(github_url: str) -> Tuple[Optional[str], Optional[str]]:
     """
     # Extract owner and repo from URL
     # Expected format: https://github.com/owner/repo
-    match = re.match(r'https://github\.com/([^/]+)/([^/]+)', github_url.rstrip('/'))
+    match = _GITHUB_REPO_RE.match(github_url.rstrip('/'))
     if not match:
         return None, "Invalid GitHub URL format"
 
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import os
-from typing import List, Tuple
+from collections import deque
+from typing import Deque, List, Tuple
 
 import boto3
 from boto3.dynamodb.conditions import Key
 from flask import Blueprint, jsonify, request
 from jsonschema import ValidationError, validate
 
+from src.core.aws import BOTO_CONFIG
+
 bp = Blueprint("lineage", __name__)
 
 # --- DynamoDB wiring ---
@@ -23,7 +26,12 @@ if endpoint_url:
         "region_name": os.getenv("AWS_DEFAULT_REGION", "us-east-1")
     }
 
-_dynamodb = boto3.resource("dynamodb", **dynamodb_config)
+# Shared keep-alive pool and retry policy (src.core.aws)
+_dynamodb = boto3.resource(
+    "dynamodb",
+    config=BOTO_CONFIG,
+    **dynamodb_config,
+)
 _lineage_table = _dynamodb.Table(LINEAGE_TABLE_NAME)
 
 
@@ -130,10 +138,10 @@ def _compute_lineage(
     nodes: List[dict] = [{"id": root_id, "level": 0}]
     edges: List[dict] = []
 
-    queue: List[Tuple[str, int]] = [(root_id, 0)]
+    queue: Deque[Tuple[str, int]] = deque([(root_id, 0)])
 
     while queue:
-        current_id, level = queue.pop(0)
+        current_id, level = queue.popleft()
         if level >= depth:
             continue
 
@@ -4,10 +4,12 @@ Input validation utilities for API endpoints.
 
 SECURITY FIX: URL validation to prevent SSRF attacks.
 """
-import re
+import ipaddress
 from typing import Tuple
 from urllib.parse import urlparse
 
+import idna
+
 
 # Allowed domains for model URLs
 ALLOWED_DOMAINS = [
@@ -16,6 +18,7 @@ ALLOWED_DOMAINS = [
     "www.huggingface.co",
     "www.github.com",
 ]
+_ALLOWED_DOMAINS = frozenset(ALLOWED_DOMAINS)
 
 
 def validate_model_url(url: str) -> Tuple[bool, str]:
@@ -57,15 +60,24 @@ def validate_model_url(url: str) -> Tuple[bool, str]:
     if not parsed.netloc:
         return False, "URL must have a valid domain"
 
-    # Extract hostname (without port)
-    hostname = parsed.netloc.split(':')[0].lower()
+    # urlparse already gives the hostname lowercased, without port/userinfo
+    hostname = parsed.hostname or ""
+
+    # Non-ASCII hosts are mapped the way requests will resolve them (UTS #46
+    # + punycode), so lookalikes such as fullwidth "ｌocalhost" can't slip
+    # past the checks below and homoglyphs end up as xn-- labels.
+    if not hostname.isascii():
+        try:
+            hostname = idna.encode(hostname, uts46=True).decode("ascii")
+        except idna.IDNAError:
+            return False, "URL must have a valid domain"
 
     # Block localhost and private IPs
     if _is_private_address(hostname):
         return False, "Private addresses and localhost are not allowed"
 
     # Check against whitelist
-    if hostname not in ALLOWED_DOMAINS:
+    if hostname not in _ALLOWED_DOMAINS:
         allowed = ", ".join(ALLOWED_DOMAINS)
         return False, f"Domain not allowed. Allowed domains: {allowed}"
 
@@ -81,32 +93,25 @@ def _is_private_address(hostname: str) -> bool:
     - Private IPv4: 10.x.x.x, 172.16-31.x.x, 192.168.x.x
     - Link-local: 169.254.x.x
     - Metadata endpoints: 169.254.169.254 (AWS)
+    - Private/link-local/unique-local IPv6 (fc00::/7, fe80::/10)
+    - Malformed dotted-quad addresses
     """
     # Localhost variants
     if hostname in ['localhost', '127.0.0.1', '::1', '0.0.0.0']:
         return True
 
-    # Check for private IPv4 ranges
-    ipv4_pattern = re.compile(r'^(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})$')
-    match = ipv4_pattern.match(hostname)
-
-    if match:
-        octets = [int(x) for x in match.groups()]
-
-        # Validate octets
-        if any(octet > 255 for octet in octets):
-            return True  # Invalid IP, block it
-
-        # Private ranges
-        if octets[0] == 10:  # 10.0.0.0/8
-            return True
-        if octets[0] == 172 and 16 <= octets[1] <= 31:  # 172.16.0.0/12
-            return True
-        if octets[0] == 192 and octets[1] == 168:  # 192.168.0.0/16
-            return True
-        if octets[0] == 169 and octets[1] == 254:  # 169.254.0.0/16 (link-local + metadata)
-            return True
-        if octets[0] == 127:  # 127.0.0.0/8 (loopback)
-            return True
-
-    return False
+    try:
+        ip = ipaddress.ip_address(hostname)
+    except ValueError:
+        # Not an IP literal. Dotted-quad lookalikes that failed to parse
+        # (octet > 255, leading zeros) are blocked to fail secure.
+        parts = hostname.split('.')
+        return len(parts) == 4 and all(p.isdigit() for p in parts)
+
+    return (
+        ip.is_private
+        or ip.is_loopback
+        or ip.is_link_local
+        or ip.is_reserved
+        or ip.is_unspecified
+    )
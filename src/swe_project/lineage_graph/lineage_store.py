@@ -8,6 +8,8 @@ from typing import Iterable, TypedDict
 
 import boto3
 
+from src.core.aws import BOTO_CONFIG
+
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +32,10 @@ class Edge(TypedDict):
 # Table name can be overridden via env var; default for your project:
 _TABLE_NAME = os.environ.get("LINEAGE_TABLE_NAME", "ModelLineage")
 
-_dynamodb = boto3.resource("dynamodb")
+# Shared keep-alive pool and retry policy (src.core.aws)
+_dynamodb = boto3.resource(
+    "dynamodb", config=BOTO_CONFIG
+)
 _table = _dynamodb.Table(_TABLE_NAME)
 
 
@@ -132,6 +137,7 @@ def get_lineage(entity_id: str) -> dict:
     
     visited_nodes = set()
     edges_list = []
+    seen_edges = set()  # (from, to, relationship) keys already in edges_list
     nodes_list = []
     
     def _traverse(node_id: str):
@@ -162,11 +168,15 @@ def get_lineage(entity_id: str) -> dict:
                 to_id = item.get("to_id")
                 edge_type = item.get("edge_type", "DERIVED_FROM")
                 
-                edges_list.append({
-                    "from_node_artifact_id": from_id,
-                    "to_node_artifact_id": to_id,
-                    "relationship": edge_type.lower().replace("_", " ")
-                })
+                relationship = edge_type.lower().replace("_", " ")
+                edge_key = (from_id, to_id, relationship)
+                if edge_key not in seen_edges:
+                    seen_edges.add(edge_key)
+                    edges_list.append({
+                        "from_node_artifact_id": from_id,
+                        "to_node_artifact_id": to_id,
+                        "relationship": relationship
+                    })
                 
                 # Recursively traverse the target node
                 _traverse(to_id)
@@ -185,14 +195,16 @@ def get_lineage(entity_id: str) -> dict:
                 to_id = item.get("to_id")
                 edge_type = item.get("edge_type", "DERIVED_FROM")
                 
-                # Check if we already have this edge
-                edge_dict = {
-                    "from_node_artifact_id": from_id,
-                    "to_node_artifact_id": to_id,
-                    "relationship": edge_type.lower().replace("_", " ")
-                }
-                if edge_dict not in edges_list:
-                    edges_list.append(edge_dict)
+                # Skip edges already collected from the other endpoint's OUT side
+                relationship = edge_type.lower().replace("_", " ")
+                edge_key = (from_id, to_id, relationship)
+                if edge_key not in seen_edges:
+                    seen_edges.add(edge_key)
+                    edges_list.append({
+                        "from_node_artifact_id": from_id,
+                        "to_node_artifact_id": to_id,
+                        "relationship": relationship
+                    })
                 
                 # Recursively traverse the source node
                 _traverse(from_id)
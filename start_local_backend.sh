@@ -9,6 +9,8 @@ export AWS_ENDPOINT_URL=http://localhost:8000
 export AWS_ACCESS_KEY_ID=dummy
 export AWS_SECRET_ACCESS_KEY=dummy
 export AWS_DEFAULT_REGION=us-east-1
+# setup_local_db.py backfills the artifact name index, so list through it
+export ARTIFACT_NAME_INDEX_READY=true
 
 # Optional: Set GitHub token if you have one
 # export GITHUB_TOKEN=your_github_token_here
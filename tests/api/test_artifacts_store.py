@@ -0,0 +1,389 @@
+# tests/api/test_artifacts_store.py
+"""
+Tests for the DynamoDB-backed artifact store lookups.
+"""
+import re
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError
+
+from swe_project.api import artifacts_store
+from swe_project.api.artifacts_store import NAME_INDEX, ArtifactStore
+
+
+def _item(artifact_id, name, atype="model"):
+    return {
+        "modelId": f"artifact#{artifact_id}",
+        "artifact_id": artifact_id,
+        "artifact_type": atype,
+        "artifact_name": name,
+        "artifact_name_key": name.casefold(),
+        "artifact_url": f"https://huggingface.co/org/{name}",
+        "record_type": "artifact",
+    }
+
+
+def _wire(item):
+    """The low-level client's typed form of a test item."""
+    return {k: {"N": str(v)} if isinstance(v, int) else {"S": v} for k, v in item.items()}
+
+
+@pytest.fixture
+def table():
+    """
+    A mock table scanned as a single segment, so scan side effects stay
+    ordered, whose name index has been backfilled.
+    """
+    mock_table = MagicMock()
+    with patch.object(artifacts_store, "_get_table", return_value=mock_table), \
+            patch.object(artifacts_store, "_SCAN_SEGMENTS", 1), \
+            patch.object(artifacts_store, "_name_index_ready", return_value=True):
+        yield mock_table
+
+
+@pytest.fixture
+def legacy_table(table):
+    """`table` before the name-key backfill: the index misses older artifacts."""
+    with patch.object(artifacts_store, "_name_index_ready", return_value=False):
+        yield table
+
+
+def test_list_by_name_queries_name_index(table):
+    table.meta.client.query.return_value = {"Items": [_wire(_item("1", "BERT"))]}
+
+    recs = ArtifactStore().list_by_name("bert")
+
+    assert [r["metadata"]["id"] for r in recs] == ["1"]
+    kwargs = table.meta.client.query.call_args.kwargs
+    assert kwargs["IndexName"] == NAME_INDEX
+    assert kwargs["ExpressionAttributeValues"][":nk"] == {"S": "bert"}
+    table.scan.assert_not_called()
+
+
+def test_list_by_name_falls_back_to_scan_without_index(table):
+    table.meta.client.query.side_effect = ClientError(
+        {"Error": {"Code": "ValidationException", "Message": "no such index"}}, "Query"
+    )
+    table.scan.return_value = {"Items": [_item("1", "bert"), _item("2", "gpt2")]}
+
+    recs = ArtifactStore().list_by_name("BERT")
+
+    assert [r["metadata"]["id"] for r in recs] == ["1"]
+
+
+def test_listings_scan_until_name_keys_are_backfilled(legacy_table):
+    # "1" predates artifact_name_key, so only a scan finds it
+    legacy = {k: v for k, v in _item("1", "BERT").items() if k != "artifact_name_key"}
+    legacy_table.scan.return_value = {"Items": [legacy, _item("2", "gpt2")]}
+    store = ArtifactStore()
+
+    assert [r["metadata"]["id"] for r in store.list_by_name("bert")] == ["1"]
+    assert [r["metadata"]["id"] for r in store.list_by_queries([{"name": "*"}])] == ["1", "2"]
+    assert [r["metadata"]["id"] for r in store.list_by_regex("^bert$")] == ["1"]
+    legacy_table.meta.client.query.assert_not_called()
+    assert all("IndexName" not in c.kwargs for c in legacy_table.scan.call_args_list)
+
+
+def test_backfill_keys_legacy_artifacts_only():
+    table = MagicMock()
+    table.scan.return_value = {"Items": [
+        {"modelId": "artifact#1", "artifact_name": "BERT"},
+        {"modelId": "artifact#2", "artifact_name": "gpt2", "artifact_name_key": "gpt2"},
+    ]}
+
+    with patch.object(artifacts_store, "_SCAN_SEGMENTS", 1):
+        assert artifacts_store.backfill_name_keys(table) == 1
+
+    update = table.update_item.call_args.kwargs
+    assert update["Key"] == {"modelId": "artifact#1"}
+    assert update["ExpressionAttributeValues"] == {":nk": "bert"}
+    # readiness lives in the deploy's config, not as an item in the table
+    table.put_item.assert_not_called()
+
+
+@pytest.mark.parametrize("value, ready", [("true", True), ("1", True), ("false", False), ("", False)])
+def test_name_index_ready_follows_deploy_flag(monkeypatch, value, ready):
+    monkeypatch.setenv("ARTIFACT_NAME_INDEX_READY", value)
+    assert artifacts_store._name_index_ready() is ready
+
+
+def _fake_index_query(items):
+    """A client.query stand-in applying NAME_INDEX's key and type filter."""
+    def query(**kw):
+        values = kw["ExpressionAttributeValues"]
+        types = {v["S"] for k, v in values.items() if k.startswith(":t")}
+        return {"Items": [
+            _wire(i) for i in items
+            if (":nk" not in values or i["artifact_name_key"] == values[":nk"]["S"])
+            and (not types or i["artifact_type"] in types)
+        ]}
+    return query
+
+
+def test_list_by_queries_named_and_wildcard(table):
+    table.meta.client.query.side_effect = _fake_index_query(
+        [_item("1", "bert"), _item("3", "gpt2"), _item("2", "bert", "dataset")]
+    )
+
+    named = ArtifactStore().list_by_queries([{"name": "bert", "types": ["dataset"]}])
+    assert [r["metadata"]["id"] for r in named] == ["2"]
+    assert table.meta.client.query.call_args.kwargs["FilterExpression"] == "artifact_type IN (:t0)"
+
+    everything = ArtifactStore().list_by_queries([{"name": "*"}, {"name": "bert"}, {"name": "*"}])
+    assert [r["metadata"]["id"] for r in everything] == ["1", "3", "2"]
+    # one index query per distinct read; no table scans
+    assert table.meta.client.query.call_count == 3
+    table.scan.assert_not_called()
+
+
+def test_created_items_carry_name_key(table):
+    ArtifactStore().create("code", "https://example.com/org/MyRepo")
+
+    item = artifacts_store._from_wire(table.meta.client.put_item.call_args.kwargs["Item"])
+    assert item["artifact_name_key"] == "myrepo"
+    table.put_item.assert_not_called()
+
+
+def test_create_reads_the_clock_once(table):
+    with patch.object(artifacts_store, "_now_ts", return_value=1700000000) as now:
+        rec = ArtifactStore().create("code", "https://example.com/org/MyRepo")
+
+    item = artifacts_store._from_wire(table.meta.client.put_item.call_args.kwargs["Item"])
+    assert item["created_at"] == item["updated_at"] == rec["created_at"] == 1700000000
+    assert now.call_count == 1
+
+
+def test_reset_batches_deletes_over_key_only_scan(table):
+    table.scan.side_effect = [
+        {"Items": [{"modelId": "artifact#1"}], "LastEvaluatedKey": {"modelId": "artifact#1"}},
+        {"Items": [{"modelId": "artifact#2"}]},
+    ]
+    batch = table.batch_writer.return_value.__enter__.return_value
+
+    ArtifactStore().reset()
+
+    assert table.scan.call_args.kwargs["ProjectionExpression"] == "modelId"
+    table.batch_writer.assert_called_once_with(overwrite_by_pkeys=["modelId"])
+    assert [c.kwargs["Key"]["modelId"] for c in batch.delete_item.call_args_list] == [
+        "artifact#1",
+        "artifact#2",
+    ]
+    table.delete_item.assert_not_called()
+
+
+def test_reset_ignores_missing_table_but_not_other_errors(table):
+    def _err(code):
+        return ClientError({"Error": {"Code": code}}, "Scan")
+
+    table.scan.side_effect = _err("ResourceNotFoundException")
+    ArtifactStore().reset()
+
+    table.scan.side_effect = _err("AccessDeniedException")
+    with pytest.raises(ClientError):
+        ArtifactStore().reset()
+
+
+def test_listing_projects_away_readme(table):
+    table.scan.return_value = {"Items": [_item("1", "bert")]}
+
+    ArtifactStore().list_by_queries([{"name": "*"}])
+    projection = table.meta.client.query.call_args.kwargs["ProjectionExpression"]
+    assert "artifact_readme" not in projection
+
+    ArtifactStore().list_by_regex("bert")
+    assert "artifact_readme" in table.scan.call_args.kwargs["ProjectionExpression"]
+
+    table.meta.client.get_item.return_value = {"Item": _wire(_item("1", "bert"))}
+    assert ArtifactStore().get("1")["metadata"]["name"] == "bert"
+    projection = table.meta.client.get_item.call_args.kwargs["ProjectionExpression"]
+    assert "artifact_readme" not in projection and "record_type" in projection
+
+
+def _conditional_failure(op):
+    return ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException", "Message": "failed"}}, op
+    )
+
+
+def test_update_is_a_single_conditional_write(table):
+    body = {
+        "metadata": {"id": "1", "name": "Bert", "type": "model"},
+        "data": {"url": "https://huggingface.co/org/bert"},
+    }
+
+    assert ArtifactStore().update("model", "1", body) is True
+
+    table.meta.client.get_item.assert_not_called()
+    kwargs = table.update_item.call_args.kwargs
+    assert kwargs["Key"] == {"modelId": "artifact#1"}
+    assert kwargs["ExpressionAttributeValues"][":artifact_name_key"] == "bert"
+    assert "download_url" not in kwargs["UpdateExpression"]
+
+
+def test_update_and_delete_report_failed_condition(table):
+    table.update_item.side_effect = _conditional_failure("UpdateItem")
+    table.delete_item.side_effect = _conditional_failure("DeleteItem")
+    body = {
+        "metadata": {"id": "1", "name": "bert", "type": "model"},
+        "data": {"url": "https://huggingface.co/org/bert"},
+    }
+
+    assert ArtifactStore().update("model", "1", body) is False
+    assert ArtifactStore().delete("model", "1") is False
+    table.meta.client.get_item.assert_not_called()
+
+
+def test_get_reads_consistently_every_time(table):
+    table.meta.client.get_item.return_value = {"Item": _wire(dict(_item("1", "bert"), created_at=7))}
+    store = ArtifactStore()
+
+    assert store.get("1")["metadata"]["name"] == "bert"
+    # another instance may have deleted it since: read again, consistently
+    table.meta.client.get_item.return_value = {}
+    assert store.get("1") is None
+    assert table.meta.client.get_item.call_count == 2
+    assert table.meta.client.get_item.call_args.kwargs["ConsistentRead"] is True
+
+
+def _no_index():
+    return ClientError(
+        {"Error": {"Code": "ValidationException", "Message": "no such index"}}, "Query"
+    )
+
+
+def test_get_readme_reads_consistently_every_time(table):
+    table.meta.client.get_item.return_value = {
+        "Item": _wire(dict(_item("1", "bert"), artifact_readme="# bert"))
+    }
+    store = ArtifactStore()
+
+    assert store.get_readme("1") == "# bert"
+    # deleted (perhaps by another instance): the next read must see it
+    table.meta.client.get_item.return_value = {}
+    assert store.get_readme("1") == ""
+    assert table.meta.client.get_item.call_count == 2
+    assert table.meta.client.get_item.call_args.kwargs["ConsistentRead"] is True
+
+
+def test_get_with_readme_is_one_read(table):
+    table.meta.client.get_item.return_value = {
+        "Item": _wire(dict(_item("1", "bert"), artifact_readme="# bert"))
+    }
+    store = ArtifactStore()
+
+    rec, readme = store.get_with_readme("1")
+    assert (rec["metadata"]["name"], readme) == ("bert", "# bert")
+    assert "artifact_readme" in table.meta.client.get_item.call_args.kwargs["ProjectionExpression"]
+    assert table.meta.client.get_item.call_count == 1
+
+    table.meta.client.get_item.return_value = {}
+    assert store.get_with_readme("2") == (None, "")
+
+
+def test_list_scans_are_eventually_consistent(table):
+    table.scan.return_value = {"Items": []}
+
+    ArtifactStore().list_by_regex("bert")
+    assert not table.scan.call_args.kwargs.get("ConsistentRead")
+
+    ArtifactStore().reset()
+    assert table.scan.call_args.kwargs["ConsistentRead"] is True
+
+
+def test_list_by_regex_matches_fields_independently(table):
+    readme_hit = dict(_item("2", "gpt2"), artifact_readme="fine-tuned from bert")
+    table.scan.return_value = {"Items": [_item("1", "bert"), readme_hit, _item("3", "t5")]}
+
+    assert [r["metadata"]["id"] for r in ArtifactStore().list_by_regex("bert")] == ["1", "2"]
+    # anchors apply to each field on its own
+    assert [r["metadata"]["id"] for r in ArtifactStore().list_by_regex("^t5$")] == ["3"]
+    assert {c.kwargs["IndexName"] for c in table.scan.call_args_list} == {NAME_INDEX}
+
+
+def test_list_by_regex_falls_back_to_table_scan_without_index(table):
+    def scan(**kw):
+        if "IndexName" in kw:
+            raise _no_index()
+        return {"Items": [_item("1", "bert"), _item("3", "t5")]}
+    table.scan.side_effect = scan
+
+    assert [r["metadata"]["id"] for r in ArtifactStore().list_by_regex("bert")] == ["1"]
+
+
+def test_scans_run_segments_in_parallel():
+    segments = 4
+    table = MagicMock()
+    table.scan.side_effect = lambda **kw: {
+        "Items": [_item(str(kw["Segment"]), f"model{kw['Segment']}")]
+    }
+    with patch.object(artifacts_store, "_get_table", return_value=table), \
+            patch.object(artifacts_store, "_SCAN_SEGMENTS", segments):
+        recs = ArtifactStore().list_by_regex("model")
+
+    assert [r["metadata"]["id"] for r in recs] == ["0", "1", "2", "3"]
+    assert {c.kwargs["TotalSegments"] for c in table.scan.call_args_list} == {segments}
+
+
+def test_typed_wildcards_filter_server_side(table):
+    items = [_item("1", "a"), _item("2", "b", "dataset"), _item("3", "c", "code"), _item("4", "d")]
+    table.meta.client.query.side_effect = _fake_index_query(items)
+
+    recs = ArtifactStore().list_by_queries([
+        {"name": "*", "types": ["code", "model"]},
+        {"name": "*", "types": ["dataset", "MODEL"]},
+        {"name": "*", "types": ["model", "code", "code"]},
+    ])
+
+    assert [r["metadata"]["id"] for r in recs] == ["1", "3", "4", "2"]
+    # the third query repeats the first filter and reuses its read
+    assert table.meta.client.query.call_count == 2
+
+
+def test_warm_connection_is_one_best_effort_get(table):
+    table.meta.client.get_item.side_effect = ClientError({"Error": {}}, "GetItem")
+
+    artifacts_store.warm_connection()
+
+    table.meta.client.get_item.assert_called_once()
+    assert "ConsistentRead" not in table.meta.client.get_item.call_args.kwargs
+
+
+def test_regex_patterns_compile_once(table):
+    table.scan.return_value = {"Items": [_item("1", "bert")]}
+    artifacts_store._cached_regex.cache_clear()
+
+    for _ in range(3):
+        assert [r["metadata"]["id"] for r in ArtifactStore().list_by_regex("BERT")] == ["1"]
+
+    info = artifacts_store._cached_regex.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+    with pytest.raises(re.error):
+        ArtifactStore().list_by_regex("(")
+
+
+def test_github_readme_prefers_listed_order_and_is_cached():
+    pages = {
+        "https://raw.githubusercontent.com/org/repo/master/README.md": "# master",
+        "https://raw.githubusercontent.com/org/repo/main/readme.md": "# lower",
+    }
+    with patch.object(artifacts_store, "_fetch_url", side_effect=lambda u: pages.get(u, "")) as fetch:
+        assert artifacts_store._github_readme("org", "repo") == "# master"
+        calls = fetch.call_count
+        assert artifacts_store._github_readme("org", "repo") == "# master"
+
+    assert fetch.call_count == calls
+
+
+@pytest.mark.parametrize("url, name", [
+    ("https://huggingface.co/google-bert/bert-base-uncased", "bert-base-uncased"),
+    ("https://huggingface.co/datasets/org/squad/tree/main?x=1", "squad"),
+    ("https://huggingface.co/org/repo/blob/main/README.md", "repo"),
+    ("https://huggingface.co/distilgpt2", "distilgpt2"),
+    ("https://huggingface.co/org/tree/main", "org"),
+    ("https://github.com/org/repo/tree/main/src", "repo"),
+    ("https://example.com/org/MyRepo/", "MyRepo"),
+])
+def test_infer_name_from_url(url, name):
+    assert artifacts_store._infer_name_from_url(url) == name
@@ -1,7 +1,24 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+
+@pytest.fixture(autouse=True)
+def _clear_process_caches():
+    """HF lookups and GitHub READMEs are memoized process-wide; don't let them leak between tests."""
+    yield
+    for name in (
+        "core.hf_client",
+        "src.core.hf_client",
+        "swe_project.api.artifacts_store",
+        "src.swe_project.api.artifacts_store",
+    ):
+        mod = sys.modules.get(name)
+        if mod is not None:
+            mod.clear_cache()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from core.exec_pool import run_parallel
+
+
+def test_timeout_defaults_only_unfinished_tasks():
+    release = threading.Event()
+    try:
+        out = run_parallel(
+            [
+                ("fast", lambda: {"value": 0.7, "latency_ms": 1}),
+                ("slow", lambda: release.wait(5)),
+                ("boom", lambda: 1 / 0),
+            ],
+            timeout_s=0.2,
+        )
+    finally:
+        release.set()
+
+    assert out == {
+        "fast": {"value": 0.7, "latency_ms": 1},
+        "slow": {"value": 0.0, "latency_ms": 0},
+        "boom": {"value": 0.0, "latency_ms": 0},
+    }
+
+
+def test_all_tasks_run_at_once():
+    # more tasks than the old shared 8-worker pool, each blocking until all start
+    n = 12
+    barrier = threading.Barrier(n, timeout=2)
+    start = time.monotonic()
+    out = run_parallel([(str(i), lambda: barrier.wait() >= 0) for i in range(n)], timeout_s=5)
+    assert all(out[str(i)] is True for i in range(n))
+    assert time.monotonic() - start < 2
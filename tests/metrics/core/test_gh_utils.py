@@ -0,0 +1,119 @@
+from types import SimpleNamespace
+
+import pytest
+
+from core import gh_utils as gh
+
+
+def _resp(status, body=None, etag=None):
+    return SimpleNamespace(
+        status_code=status,
+        text="",
+        headers={"ETag": etag} if etag else {},
+        json=lambda: body,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    gh._GH_CACHE.clear()
+    yield
+    gh._GH_CACHE.clear()
+
+
+def test_gh_get_serves_repeat_calls_from_cache(monkeypatch):
+    calls = []
+
+    def fake_get(url, headers, params, timeout):
+        calls.append(url)
+        return _resp(200, {"n": len(calls)})
+
+    monkeypatch.setattr(gh._SESSION, "get", fake_get)
+
+    first = gh.gh_get("https://api.github.com/repos/o/r")
+    second = gh.gh_get("https://api.github.com/repos/o/r")
+    assert first is second
+    assert calls == ["https://api.github.com/repos/o/r"]
+
+
+def test_gh_get_revalidates_with_etag_after_ttl(monkeypatch):
+    sent = []
+    replies = [_resp(200, {"v": 1}, etag='"abc"'), _resp(304)]
+
+    def fake_get(url, headers, params, timeout):
+        sent.append(headers.get("If-None-Match"))
+        return replies.pop(0)
+
+    monkeypatch.setattr(gh._SESSION, "get", fake_get)
+    monkeypatch.setattr(gh, "_GH_CACHE_TTL", 0.0)
+
+    first = gh.gh_get("https://api.github.com/repos/o/r")
+    second = gh.gh_get("https://api.github.com/repos/o/r")
+    assert second is first
+    assert second.json() == {"v": 1}
+    assert sent == [None, '"abc"']
+
+
+def test_gh_get_does_not_cache_failures(monkeypatch):
+    replies = [_resp(500), _resp(200, {"ok": True})]
+    monkeypatch.setattr(gh._SESSION, "get", lambda *a, **k: replies.pop(0))
+
+    assert gh.gh_get("https://api.github.com/repos/o/r") is None
+    assert gh.gh_get("https://api.github.com/repos/o/r").json() == {"ok": True}
+
+
+def _tree(*paths):
+    import orjson
+
+    body = {"tree": [{"path": p, "type": "blob"} for p in paths]}
+    return SimpleNamespace(
+        status_code=200, text="", headers={}, content=orjson.dumps(body), json=lambda: body
+    )
+
+
+def test_repo_files_try_main_before_any_metadata_lookup(monkeypatch):
+    urls = []
+
+    def fake_get(url, headers, params, timeout):
+        urls.append(url)
+        return _tree("train.py", "README.md")
+
+    monkeypatch.setattr(gh._SESSION, "get", fake_get)
+
+    assert gh.get_github_repo_files("https://github.com/o/r") == {"train.py", "README.md"}
+    assert urls == ["https://api.github.com/repos/o/r/git/trees/main?recursive=1"]
+
+
+def test_repo_files_fall_back_to_master_then_the_default_branch(monkeypatch):
+    urls = []
+
+    def fake_get(url, headers, params, timeout):
+        urls.append(url)
+        if url.endswith("/repos/o/r"):
+            return _resp(200, {"default_branch": "dev"})
+        if "/trees/dev" in url:
+            return _tree("train.py")
+        return _resp(404)
+
+    monkeypatch.setattr(gh._SESSION, "get", fake_get)
+
+    assert gh.get_github_repo_files("https://github.com/o/r") == {"train.py"}
+    assert urls == [
+        "https://api.github.com/repos/o/r/git/trees/main?recursive=1",
+        "https://api.github.com/repos/o/r/git/trees/master?recursive=1",
+        "https://api.github.com/repos/o/r",
+        "https://api.github.com/repos/o/r/git/trees/dev?recursive=1",
+    ]
+
+
+def test_repo_files_do_not_memoize_a_failed_fetch(monkeypatch):
+    down = [True]
+
+    def fake_get(url, headers, params, timeout):
+        return _resp(503) if down[0] else _tree("a.py")
+
+    monkeypatch.setattr(gh._SESSION, "get", fake_get)
+
+    assert gh.get_github_repo_files("https://github.com/o/r") == set()
+    down[0] = False
+    assert gh.get_github_repo_files("https://github.com/o/r") == {"a.py"}
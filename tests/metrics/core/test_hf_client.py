@@ -1,3 +1,8 @@
+import threading
+import time
+
+import pytest
+
 from core import hf_client as hc
 
 
@@ -19,6 +24,42 @@ def test_model_info_calls_hfapi(monkeypatch):
     assert called["rid"] == "org/name"
 
 
+def test_model_info_is_cached_per_repo(monkeypatch):
+    calls = []
+
+    class FakeApi:
+        def model_info(self, rid):
+            calls.append(rid)
+            return {"rid": rid}
+
+    monkeypatch.setattr(hc, "_api", FakeApi())
+
+    first = hc.model_info("org/a")
+    assert first == {"rid": "org/a"}
+    # served as is: no per-hit copy of a potentially large ModelInfo
+    assert hc.model_info("org/a") is first
+    assert hc.model_info("org/b") == {"rid": "org/b"}
+    assert calls == ["org/a", "org/b"]
+
+
+def test_model_info_errors_are_not_cached(monkeypatch):
+    calls = []
+
+    class FakeApi:
+        def model_info(self, rid):
+            calls.append(rid)
+            if len(calls) == 1:
+                raise RuntimeError("HF down")
+            return {"rid": rid}
+
+    monkeypatch.setattr(hc, "_api", FakeApi())
+
+    with pytest.raises(RuntimeError):
+        hc.model_info("org/name")
+    assert hc.model_info("org/name") == {"rid": "org/name"}
+    assert len(calls) == 2
+
+
 def test_dataset_info_calls_hfapi(monkeypatch):
     class FakeApi:
         def model_info(self, rid):
@@ -51,3 +92,122 @@ def test_download_snapshot_passes_through(monkeypatch, tmp_path):
     assert captured["repo_id"] == "org/name"
     assert captured["allow_patterns"] == ["*.json", "*.md"]
     assert captured["symlinks"] is False
+
+
+def test_model_config_prefers_local_cache(monkeypatch, tmp_path):
+    cfg = tmp_path / "config.json"
+    cfg.write_text('{"model_type": "bert"}', encoding="utf-8")
+    calls = []
+
+    def fake_hf_hub_download(*, repo_id, filename, local_files_only=False, **kwargs):
+        calls.append(local_files_only)
+        return cfg.as_posix()
+
+    monkeypatch.setattr(hc, "hf_hub_download", fake_hf_hub_download)
+
+    assert hc.model_config("org/name") == {"model_type": "bert"}
+    assert calls == [True]
+
+
+def test_model_config_falls_back_to_network(monkeypatch, tmp_path):
+    cfg = tmp_path / "config.json"
+    cfg.write_text('{"model_type": "gpt2"}', encoding="utf-8")
+    calls = []
+
+    def fake_hf_hub_download(*, repo_id, filename, local_files_only=False, **kwargs):
+        calls.append(local_files_only)
+        if local_files_only:
+            raise hc.LocalEntryNotFoundError("not cached")
+        return cfg.as_posix()
+
+    monkeypatch.setattr(hc, "hf_hub_download", fake_hf_hub_download)
+
+    assert hc.model_config("org/name") == {"model_type": "gpt2"}
+    assert calls == [True, False]
+
+
+def test_model_config_malformed_returns_empty(monkeypatch, tmp_path):
+    cfg = tmp_path / "config.json"
+    cfg.write_bytes(b"{not json")
+
+    monkeypatch.setattr(hc, "hf_hub_download", lambda **kwargs: cfg.as_posix())
+
+    assert hc.model_config("org/name") == {}
+
+
+def test_model_config_missing_returns_empty(monkeypatch):
+    def fake_hf_hub_download(**kwargs):
+        raise hc.EntryNotFoundError("no config.json")
+
+    monkeypatch.setattr(hc, "hf_hub_download", fake_hf_hub_download)
+
+    assert hc.model_config("org/name") == {}
+
+
+def test_download_snapshot_reuses_path_for_same_patterns(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_snapshot_download(*, repo_id, allow_patterns, **kwargs):
+        calls.append(tuple(allow_patterns))
+        return tmp_path.as_posix()
+
+    monkeypatch.setattr(hc, "snapshot_download", fake_snapshot_download)
+
+    assert hc.download_snapshot("org/name", ["README.md"]) == tmp_path.as_posix()
+    assert hc.download_snapshot("org/name", ["README.md"]) == tmp_path.as_posix()
+    hc.download_snapshot("org/name", ["config.json"])
+    assert calls == [("README.md",), ("config.json",)]
+
+
+def test_model_config_callers_get_their_own_copy(monkeypatch, tmp_path):
+    cfg = tmp_path / "config.json"
+    cfg.write_text('{"architectures": ["BertModel"]}', encoding="utf-8")
+    monkeypatch.setattr(hc, "hf_hub_download", lambda **kwargs: cfg.as_posix())
+
+    first = hc.model_config("org/name")
+    first["architectures"].append("mutated")
+    assert hc.model_config("org/name") == {"architectures": ["BertModel"]}
+
+
+def test_late_caller_waits_for_a_retry_in_flight(monkeypatch):
+    calls = []
+    loading = [threading.Event(), threading.Event()]
+    release = [threading.Event(), threading.Event()]
+
+    class FakeApi:
+        def model_info(self, rid):
+            n = len(calls)
+            calls.append(rid)
+            if n < 2:
+                loading[n].set()
+                release[n].wait(5)
+            if n == 0:
+                raise RuntimeError("HF down")
+            return {"rid": rid}
+
+    monkeypatch.setattr(hc, "_api", FakeApi())
+    results = []
+
+    def call():
+        try:
+            results.append(hc.model_info("org/name"))
+        except RuntimeError as e:
+            results.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    threads[0].start()
+    loading[0].wait(5)
+    threads[1].start()
+    time.sleep(0.05)  # let it queue on the key lock
+    release[0].set()
+    loading[1].wait(5)
+    # arrives while the waiter's retry is in flight: must not fetch again
+    threads[2].start()
+    time.sleep(0.05)
+    release[1].set()
+    for t in threads:
+        t.join(5)
+
+    assert len(calls) == 2
+    assert results.count({"rid": "org/name"}) == 2
+    assert not hc._KEY_LOCKS
@@ -62,9 +62,32 @@ def test_availability_zero_score(mock_model_info) -> None:
     assert isinstance(out["latency_ms"], int)
 
 
+@patch.object(dca, "model_info", autospec=True)
+def test_availability_missing_siblings(mock_model_info) -> None:
+    """A model_info without a file listing should still score its other signals."""
+    info = _create_mock_info(has_dataset=True, has_space=True)
+    info.siblings = None
+    mock_model_info.return_value = info
+
+    out = dca.compute("https://huggingface.co/org/model")
+    assert out["value"] == 0.7
+
+
 @patch.object(dca, "model_info", side_effect=Exception("API failed"), autospec=True)
 def test_availability_handles_exception(mock_model_info) -> None:
     """Any failure during API call should result in a score of 0.0."""
     out = dca.compute("https://huggingface.co/org/model")
     assert out["value"] == 0.0
     assert isinstance(out["latency_ms"], int)
+
+
+@patch.object(dca, "get_github_repo_files", side_effect=[set(), {"train.py"}])
+@patch.object(dca, "model_info", autospec=True)
+def test_failed_github_listing_is_not_remembered(mock_model_info, mock_files) -> None:
+    """A transient GitHub failure only costs the line it happened on."""
+    mock_model_info.return_value = _create_mock_info()
+    line = "https://github.com/org/code, https://huggingface.co/org/model"
+
+    assert dca.compute(line)["value"] == 0.0
+    assert dca.compute(line)["value"] == 0.3
+    assert mock_files.call_count == 2
@@ -50,17 +50,12 @@ def test_local_repo_missing_readme_returns_zero(tmp_path):
     assert out["value"] == 0.0
 
 
-# ---------- Hugging Face URL branch (snapshot path) ----------
+# ---------- Hugging Face URL branch (README fetch) ----------
 
 
-def test_hf_url_uses_download_snapshot_and_clamps_high(monkeypatch, tmp_path):
-    # Make a fake local dir returned by download_snapshot with a README inside
-    fake_dir = tmp_path / "snap"
-    _write_readme(fake_dir, "Docs go here")
+def test_hf_url_uses_readme_text_and_clamps_high(monkeypatch):
     # patch the symbol imported in this module
-    monkeypatch.setattr(
-        rt, "download_snapshot", lambda repo_id, allow_patterns: fake_dir.as_posix()
-    )
+    monkeypatch.setattr(rt, "readme_text", lambda repo_id: "Docs go here")
     # LLM returns >1.0; result must be clamped to 1.0
     monkeypatch.setattr(rt, "ask_llm", lambda *a, **k: "1.23")
 
@@ -68,13 +63,69 @@ def test_hf_url_uses_download_snapshot_and_clamps_high(monkeypatch, tmp_path):
     assert out["value"] == 1.0
 
 
-def test_hf_url_clamps_negative(monkeypatch, tmp_path):
-    fake_dir = tmp_path / "snap2"
-    _write_readme(fake_dir, "Docs go here")
-    monkeypatch.setattr(
-        rt, "download_snapshot", lambda repo_id, allow_patterns: fake_dir.as_posix()
-    )
+def test_hf_url_clamps_negative(monkeypatch):
+    monkeypatch.setattr(rt, "readme_text", lambda repo_id: "Docs go here")
     monkeypatch.setattr(rt, "ask_llm", lambda *a, **k: "-0.2")
 
     out = rt.compute("https://huggingface.co/org/name")
     assert out["value"] == 0.0
+
+
+def test_hf_url_missing_readme_skips_llm(monkeypatch):
+    monkeypatch.setattr(rt, "readme_text", lambda repo_id: "")
+
+    def _fail(*a, **k):
+        raise AssertionError("LLM should not be called without a README")
+
+    monkeypatch.setattr(rt, "ask_llm", _fail)
+    out = rt.compute("https://huggingface.co/org/name")
+    assert out["value"] == 0.0
+
+
+# ---------- Batched scoring ----------
+
+
+def test_compute_batch_single_llm_call(monkeypatch):
+    readmes = {"org/a": "Docs A", "org/b": "", "org/c": "Docs C"}
+    monkeypatch.setattr(rt, "readme_text", lambda repo_id: readmes[repo_id])
+    calls = []
+
+    def _llm(messages, *a, **k):
+        calls.append(messages)
+        return "0.4\n0.9"
+
+    monkeypatch.setattr(rt, "ask_llm", _llm)
+    out = rt.compute_batch([f"https://huggingface.co/{r}" for r in readmes])
+    assert [o["value"] for o in out] == [0.4, 0.0, 0.9]
+    assert len(calls) == 1
+
+
+def test_compute_batch_falls_back_on_unparseable_reply(monkeypatch):
+    monkeypatch.setattr(rt, "readme_text", lambda repo_id: f"Docs for {repo_id}")
+    replies = iter(["I cannot rate these.", "0.2", "0.7"])
+    monkeypatch.setattr(rt, "ask_llm", lambda *a, **k: next(replies))
+    out = rt.compute_batch(["https://huggingface.co/org/a", "https://huggingface.co/org/b"])
+    assert [o["value"] for o in out] == [0.2, 0.7]
+
+
+def test_compute_batch_strips_numbered_labels(monkeypatch):
+    monkeypatch.setattr(rt, "readme_text", lambda repo_id: f"Docs for {repo_id}")
+    calls = []
+
+    def _llm(*a, **k):
+        calls.append(a)
+        return "1. 0.4\nREADME 2: 0.6\n**README 3:** 0.8"
+
+    monkeypatch.setattr(rt, "ask_llm", _llm)
+    out = rt.compute_batch([f"https://huggingface.co/org/{r}" for r in "abc"])
+    assert [o["value"] for o in out] == [0.4, 0.6, 0.8]
+    assert len(calls) == 1
+
+
+def test_compute_batch_falls_back_on_ambiguous_numbered_line(monkeypatch):
+    monkeypatch.setattr(rt, "readme_text", lambda repo_id: f"Docs for {repo_id}")
+    # "1 0.4" holds two numbers: neither may be read as the score
+    replies = iter(["1 0.4\n2 0.6", "0.3", "0.5"])
+    monkeypatch.setattr(rt, "ask_llm", lambda *a, **k: next(replies))
+    out = rt.compute_batch(["https://huggingface.co/org/a", "https://huggingface.co/org/b"])
+    assert [o["value"] for o in out] == [0.3, 0.5]
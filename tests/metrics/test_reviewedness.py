@@ -13,6 +13,12 @@ from unittest.mock import patch, MagicMock
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def github_token(monkeypatch):
+    """Reviewedness only queries GitHub when a token is configured."""
+    monkeypatch.setenv("GITHUB_TOKEN", "ghp_test")
+
+
 @pytest.fixture
 def mock_download_snapshot():
     """Mock download_snapshot to return a temp directory with test files."""
@@ -29,9 +35,12 @@ def mock_model_info():
 
 @pytest.fixture
 def mock_requests():
-    """Mock requests for GitHub API calls."""
-    with patch('metrics.reviewedness.requests') as mock:
-        yield mock
+    """Mock the shared GitHub session used for API calls."""
+    with patch('metrics.reviewedness._get_session') as mock:
+        session = mock.return_value
+        # GraphQL unavailable by default, so calls fall back to REST
+        session.post.return_value.status_code = 503
+        yield session
 
 
 def test_reviewedness_no_github_repo(mock_download_snapshot):
@@ -223,6 +232,128 @@ def test_reviewedness_partial_reviews(mock_download_snapshot, mock_requests):
         assert result["value"] == 0.5
 
 
+def test_reviewedness_no_token_skips_lookup(
+    mock_download_snapshot, mock_requests, monkeypatch
+):
+    """Test that a missing token returns -1 without any downloads or API calls."""
+    from metrics.reviewedness import compute
+
+    monkeypatch.delenv("GITHUB_TOKEN")
+
+    result = compute("https://huggingface.co/my-model")
+
+    assert result["value"] == -1.0
+    mock_download_snapshot.assert_not_called()
+    mock_requests.get.assert_not_called()
+    mock_requests.post.assert_not_called()
+
+
+def test_reviewedness_graphql(mock_download_snapshot, mock_requests):
+    """Test that review counts come from a single GraphQL query."""
+    from metrics.reviewedness import compute
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        readme_path = os.path.join(tmpdir, "README.md")
+        with open(readme_path, "w") as f:
+            f.write("https://github.com/user/repo")
+
+        mock_download_snapshot.return_value = tmpdir
+
+        mock_graphql = MagicMock()
+        mock_graphql.status_code = 200
+        mock_graphql.json.return_value = {
+            "data": {
+                "repository": {
+                    "pullRequests": {
+                        "nodes": [
+                            {"number": 1, "reviews": {"totalCount": 2}},
+                            {"number": 2, "reviews": {"totalCount": 0}},
+                            {"number": 3, "reviews": {"totalCount": 1}},
+                            {"number": 4, "reviews": {"totalCount": 0}},
+                        ]
+                    }
+                }
+            }
+        }
+        mock_requests.post.return_value = mock_graphql
+
+        result = compute("https://huggingface.co/my-model")
+
+        # 2/4 = 0.5, with no REST calls
+        assert result["value"] == 0.5
+        mock_requests.get.assert_not_called()
+
+
+def test_reviewedness_graphql_null_nodes(mock_download_snapshot, mock_requests):
+    """Test that null PR nodes or review fields count as unreviewed."""
+    from metrics.reviewedness import compute
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        readme_path = os.path.join(tmpdir, "README.md")
+        with open(readme_path, "w") as f:
+            f.write("https://github.com/user/repo")
+
+        mock_download_snapshot.return_value = tmpdir
+
+        mock_graphql = MagicMock()
+        mock_graphql.status_code = 200
+        mock_graphql.json.return_value = {
+            "data": {
+                "repository": {
+                    "pullRequests": {
+                        "nodes": [
+                            {"number": 1, "reviews": {"totalCount": 3}},
+                            None,
+                            {"number": 3, "reviews": None},
+                            {"number": 4, "reviews": {"totalCount": 1}},
+                        ]
+                    }
+                }
+            }
+        }
+        mock_requests.post.return_value = mock_graphql
+
+        result = compute("https://huggingface.co/my-model")
+
+        # 2/4 = 0.5, with no REST calls
+        assert result["value"] == 0.5
+        mock_requests.get.assert_not_called()
+
+def test_reviewedness_graphql_failure_falls_back_to_rest(
+    mock_download_snapshot, mock_requests
+):
+    """Test falling back to REST when the GraphQL call fails."""
+    from metrics.reviewedness import compute
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        readme_path = os.path.join(tmpdir, "README.md")
+        with open(readme_path, "w") as f:
+            f.write("https://github.com/user/repo")
+
+        mock_download_snapshot.return_value = tmpdir
+
+        mock_graphql = MagicMock()
+        mock_graphql.status_code = 401
+        mock_requests.post.return_value = mock_graphql
+
+        mock_repo = MagicMock()
+        mock_repo.status_code = 200
+
+        mock_prs = MagicMock()
+        mock_prs.status_code = 200
+        mock_prs.json.return_value = [{"number": 1, "merged_at": "2024-01-01"}]
+
+        mock_reviews = MagicMock()
+        mock_reviews.status_code = 200
+        mock_reviews.json.return_value = [{"id": 1}]
+
+        mock_requests.get.side_effect = [mock_repo, mock_prs, mock_reviews]
+
+        result = compute("https://huggingface.co/my-model")
+
+        assert result["value"] == 1.0
+
+
 def test_reviewedness_no_merged_prs(mock_download_snapshot, mock_requests):
     """Test repository with no merged PRs."""
     from metrics.reviewedness import compute
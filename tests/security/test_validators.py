@@ -97,6 +97,18 @@ class TestURLValidation:
             assert "Domain not allowed" in error
             assert "huggingface.co" in error  # Error message should list allowed domains
 
+    def test_unicode_lookalike_hosts_normalized(self):
+        """Non-ASCII hosts are IDNA-normalized before the checks run."""
+        # fullwidth "l" maps to plain localhost -> still blocked
+        is_valid, error = validate_model_url("http://\uff4cocalhost/admin")
+        assert not is_valid
+        assert "Private" in error
+
+        # Cyrillic "a" homoglyph becomes an xn-- label, not huggingface.co
+        is_valid, error = validate_model_url("https://huggingf\u0430ce.co/model")
+        assert not is_valid
+        assert "Domain not allowed" in error
+
     def test_url_without_domain_rejected(self):
         """URL without domain should be rejected."""
         url = "https:///path"
@@ -129,6 +141,12 @@ class TestPrivateAddressDetection:
         assert _is_private_address("169.254.1.1")
         assert _is_private_address("169.254.169.254")  # AWS metadata
 
+    def test_private_ipv6_addresses(self):
+        """Unique-local and link-local IPv6 addresses should be detected."""
+        assert _is_private_address("fd00::1")
+        assert _is_private_address("fe80::1")
+        assert not _is_private_address("2606:4700:4700::1111")
+
     def test_public_ips_not_flagged(self):
         """Public IP addresses should not be flagged as private."""
         # These are not private (though we still block them via domain whitelist)